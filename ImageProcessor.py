@@ -8,26 +8,149 @@ import cv2
 import numpy
 import Settings
 
+# Numba is optional: when present the line-scan kernel below is JIT
+# compiled to native code, otherwise a vectorized numpy fallback is used
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+# ADR-008 thread priority helpers, optional when running the legacy
+# scripts outside the repository root
+try:
+    from src.core import scheduling
+except ImportError:
+    scheduling = None
+
 
 def rgb2bgr(colour):
-    (r, g, b) = colour
+    r, g, b = colour
     return b, g, r
 
 
+def _SweepLineCore(line):
+    """
+    Scan one mask line for active sections.
+
+    Works entirely on a 1-D uint8 array with preallocated outputs so Numba can
+    compile it; the state toggling matches the original change-list walk,
+    including the edge-pixel filtering.
+
+    Returns:
+        tuple: (sizes, locations) arrays for each active section found.
+    """
+    width = line.shape[0]
+    sizes = numpy.empty(width // 2 + 1, numpy.int32)
+    locations = numpy.empty(width // 2 + 1, numpy.int32)
+    count = 0
+    current = line[0] != 0
+    previousPosition = 0
+    for i in range(width - 1):
+        if line[i] != line[i + 1]:
+            # Filter out changes at the edge of the image
+            # These can be messy from the camera
+            if i < 2:
+                pass
+            elif i > (width - 3):
+                pass
+            elif current:
+                # End of high section - add to list
+                size = i - previousPosition
+                sizes[count] = size
+                locations[count] = size // 2 + previousPosition
+                count += 1
+                previousPosition = i
+            else:
+                # End of low section, mark the next start point
+                previousPosition = i
+            current = not current
+    # If we finished on a high section generate a final section for it
+    # This includes the whole line being active!
+    if current:
+        size = width - previousPosition
+        sizes[count] = size
+        locations[count] = size // 2 + previousPosition
+        count += 1
+    return sizes[:count], locations[:count]
+
+
+def _SweepLineChanges(line):
+    """
+    Scan one mask line for active sections without Numba.
+
+    Finds the change positions with a vectorized numpy.where and only walks
+    that short list in Python, so the per-pixel work stays in C. Same state
+    toggling and edge-pixel filtering as _SweepLineCore.
+
+    Returns:
+        tuple: (sizes, locations) lists for each active section found.
+    """
+    width = line.shape[0]
+    # Work out where the changes are
+    changed = numpy.where(line[:-1] != line[1:])[0]
+    sizes = []
+    locations = []
+    current = line.item(0) != 0
+    previousPosition = 0
+    for i in changed:
+        # Filter out changes at the edge of the image
+        # These can be messy from the camera
+        if i < 2:
+            pass
+        elif i > (width - 3):
+            pass
+        elif current:
+            # End of high section - add to list
+            size = int(i) - previousPosition
+            sizes.append(size)
+            locations.append(size // 2 + previousPosition)
+            previousPosition = int(i)
+        else:
+            # End of low section, mark the next start point
+            previousPosition = int(i)
+        current = not current
+    # If we finished on a high section generate a final section for it
+    # This includes the whole line being active!
+    if current:
+        size = width - previousPosition
+        sizes.append(size)
+        locations.append(size // 2 + previousPosition)
+    return sizes, locations
+
+
+if njit is not None:
+    _SweepLineCore = njit(cache=True, nogil=True)(_SweepLineCore)
+    # Warm up the JIT on a dummy line so the compile cost is paid at
+    # import time rather than on the first camera frame
+    _SweepLineCore(numpy.zeros(8, numpy.uint8))
+else:
+    # Without the JIT the per-pixel Python loop above would be far slower
+    # than the original change walk, so use the vectorized version instead
+    _SweepLineCore = _SweepLineChanges
+
+
 # PID processing thread
 class ControlLoop(threading.Thread):
-    def __init__(self):
+    def __init__(self, motorFn=None):
         super(ControlLoop, self).__init__()
         self.event = threading.Event()
         self.lock = threading.Lock()
         self.terminated = False
         self.eventWait = 2.0 / Settings.frameRate
+        # Bind the motor function once so the per-frame call is a plain
+        # local attribute call rather than a module attribute lookup
+        if motorFn is None:
+            motorFn = Settings.MonsterMotors
+        self.motorFn = motorFn
         self.Reset()
         print("Control loop thread started with idle time of %.2fs" % (self.eventWait))
         self.start()
 
     def run(self):
         # This method runs in a separate thread
+        # Motor control runs at Tier 1 priority (ADR-008)
+        if scheduling is not None:
+            scheduling.set_thread_priority(scheduling.TIER1_PRIORITY)
         while not self.terminated:
             # Wait for an image to be written to the stream
             self.event.wait(self.eventWait)
@@ -55,6 +178,14 @@ class ControlLoop(threading.Thread):
         self.clipIMax = Settings.clipI
         self.clipIMin = -Settings.clipI
         self.firTaps = Settings.motorSmoothing
+        # Cache the loop gains like the clip levels above, the per-frame
+        # PID maths then avoids six module attribute lookups per sample
+        self.kPositionP = Settings.positionP
+        self.kPositionI = Settings.positionI
+        self.kPositionD = Settings.positionD
+        self.kChangeP = Settings.changeP
+        self.kChangeI = Settings.changeI
+        self.kChangeD = Settings.changeD
         self.firHistorySpeed = []
         self.firHistorySteering = []
         self.lastSteering = 0.0
@@ -90,7 +221,7 @@ class ControlLoop(threading.Thread):
             # Turning right
             driveRight *= 1.0 - steering
         # Set the motors to the new speeds
-        Settings.MonsterMotors(driveLeft, driveRight)
+        self.motorFn(driveLeft, driveRight)
 
     def FirFilter(self, speed, steering):
         # Filtering for speed and steering
@@ -103,27 +234,27 @@ class ControlLoop(threading.Thread):
         self.SetDrive(filteredSpeed, filteredSteering)
 
     def RunLoop(self, nextVector):
-        (isGood, position, change) = nextVector
+        isGood, position, change = nextVector
         with self.lock:
             if isGood:
                 # Position offset loop
-                self.positionP = Settings.positionP * position
-                self.positionI += Settings.positionI * position
+                self.positionP = self.kPositionP * position
+                self.positionI += self.kPositionI * position
                 if self.positionI > self.clipIMax:
                     self.positionI = self.clipIMax
                 elif self.positionI < self.clipIMin:
                     self.positionI = self.clipIMin
-                self.positionD = Settings.positionD * (position - self.lastPosition)
+                self.positionD = self.kPositionD * (position - self.lastPosition)
                 self.lastPosition = position
                 self.positionPID = self.positionP + self.positionI + self.positionD
                 # Position change loop
-                self.changeP = Settings.changeP * change
-                self.changeI += Settings.changeI * change
+                self.changeP = self.kChangeP * change
+                self.changeI += self.kChangeI * change
                 if self.changeI > self.clipIMax:
                     self.changeI = self.clipIMax
                 elif self.changeI < self.clipIMin:
                     self.changeI = self.clipIMin
-                self.changeD = Settings.changeD * (change - self.lastChange)
+                self.changeD = self.kChangeD * (change - self.lastChange)
                 self.lastChange = change
                 self.changePID = self.changeP + self.changeI + self.changeD
                 # Speed and steering values
@@ -154,11 +285,28 @@ class StreamProcessor(threading.Thread):
             self.resize = True
         else:
             self.resize = False
+        # Bind the settings which are fixed after startup once, so the
+        # per-frame code reads plain attributes instead of re-resolving
+        # them through the Settings module on every frame
+        self.flippedImage = Settings.flippedImage
+        self.scaledSize = (Settings.scaledWidth, Settings.scaledHeight)
+        self.scaledWidth = Settings.scaledWidth
+        self.minBGR = numpy.array(rgb2bgr(Settings.minHuntColour))
+        self.maxBGR = numpy.array(rgb2bgr(Settings.maxHuntColour))
+        if Settings.erodeSize > 1:
+            self.erodeKernel = numpy.ones((Settings.erodeSize, Settings.erodeSize), numpy.uint8)
+        else:
+            self.erodeKernel = None
+        self.targetY1 = Settings.targetY1
+        self.targetY2 = Settings.targetY2
         print("Processor thread %s started with idle time of %.2fs" % (self.name, self.eventWait))
         self.start()
 
     def run(self):
         # This method runs in a separate thread
+        # Image processing runs at Tier 2 priority (ADR-008)
+        if scheduling is not None:
+            scheduling.set_thread_priority(scheduling.TIER2_PRIORITY)
         while not self.terminated:
             # Wait for an image to be written to the stream
             self.event.wait(self.eventWait)
@@ -167,7 +315,7 @@ class StreamProcessor(threading.Thread):
                     break
                 try:
                     # grab the image and do some processing on it
-                    if Settings.flippedImage:
+                    if self.flippedImage:
                         image = cv2.flip(self.nextFrame, -1)
                     else:
                         image = self.nextFrame
@@ -184,39 +332,9 @@ class StreamProcessor(threading.Thread):
     # Find sections in a boolean image
     # Returns a list of size and location pairs sorted by largest first
     def SweepLine(self, image, Y):
-        # Grab the line of interest
-        line = image[Y, :]
-        width = len(line)
-        # Work out where the changes are
-        changed = numpy.where(line[:-1] != line[1:])[0]
-        # Set an initial state with an edge at the start of the line
-        current = line.item(0)
-        previousPosition = 0
-        sectionsFound = []
-        # Sweep over the list of changes
-        for i in changed:
-            # Filter out changes at the edge of the image
-            # These can be messy from the camera
-            if i < 2:
-                pass
-            elif i > (width - 3):
-                pass
-            elif current:
-                # End of high section - add to list
-                size = i - previousPosition
-                location = int(size / 2) + previousPosition
-                sectionsFound.append([size, location])
-                previousPosition = i
-            else:
-                # End of low section, mark the next start point
-                previousPosition = i
-            current = not current
-        # If we finished on a high section generate a final section for it
-        # This includes the whole line being active!
-        if current:
-            size = width - previousPosition
-            location = int(size / 2) + previousPosition
-            sectionsFound.append([size, location])
+        # Scan the line of interest with the (optionally JIT compiled) kernel
+        sizes, locations = _SweepLineCore(numpy.ascontiguousarray(image[Y, :]))
+        sectionsFound = [[int(size), int(location)] for size, location in zip(sizes, locations)]
         # Finally sort by size and return
         sectionsFound.sort()
         sectionsFound.reverse()
@@ -239,18 +357,15 @@ class StreamProcessor(threading.Thread):
                 Settings.lastFrameStamp = frameStamp
         # Resize if needed
         if self.resize:
-            image = cv2.resize(image, (Settings.scaledWidth, Settings.scaledHeight), interpolation=cv2.INTER_NEAREST)
+            image = cv2.resize(image, self.scaledSize, interpolation=cv2.INTER_NEAREST)
         # Process image to get a lineMask image (boolean)
-        minBGR = numpy.array((Settings.minHuntColour[2], Settings.minHuntColour[1], Settings.minHuntColour[0]))
-        maxBGR = numpy.array((Settings.maxHuntColour[2], Settings.maxHuntColour[1], Settings.maxHuntColour[0]))
-        lineMask = cv2.inRange(image, minBGR, maxBGR)
+        lineMask = cv2.inRange(image, self.minBGR, self.maxBGR)
         # Erode the mask to remove noise
-        if Settings.erodeSize > 1:
-            erodeKernel = numpy.ones((Settings.erodeSize, Settings.erodeSize), numpy.uint8)
-            lineMask = cv2.erode(lineMask, erodeKernel)
+        if self.erodeKernel is not None:
+            lineMask = cv2.erode(lineMask, self.erodeKernel)
         # Find the line sections in our two locations
-        sectionsY1 = self.SweepLine(lineMask, Settings.targetY1)
-        sectionsY2 = self.SweepLine(lineMask, Settings.targetY2)
+        sectionsY1 = self.SweepLine(lineMask, self.targetY1)
+        sectionsY2 = self.SweepLine(lineMask, self.targetY2)
         # Pick the largest sections and take their center positions
         if len(sectionsY1) > 0:
             X1 = sectionsY1[0][1]
@@ -276,14 +391,12 @@ class StreamProcessor(threading.Thread):
                 displayImage /= 2
             # Draw line between points
             if (X1 is not None) and (X2 is not None):
-                cv2.line(
-                    displayImage, (X1, Settings.targetY1), (X2, Settings.targetY2), Settings.targetLine, 1, lineType=cv2.CV_AA
-                )
+                cv2.line(displayImage, (X1, self.targetY1), (X2, self.targetY2), Settings.targetLine, 1, lineType=cv2.CV_AA)
             # Draw circles around points
             if X1 is not None:
                 cv2.circle(
                     displayImage,
-                    (X1, Settings.targetY1),
+                    (X1, self.targetY1),
                     Settings.targetPointSize,
                     Settings.targetPoints,
                     1,
@@ -292,13 +405,14 @@ class StreamProcessor(threading.Thread):
             if X2 is not None:
                 cv2.circle(
                     displayImage,
-                    (X2, Settings.targetY2),
+                    (X2, self.targetY2),
                     Settings.targetPointSize,
                     Settings.targetPoints,
                     1,
                     lineType=cv2.CV_AA,
                 )
             Settings.displayFrame = displayImage
+            Settings.displayEvent.set()
         # Pass the results to the control loop
         # Offset is most important, but ideally we need both
         if (X1 is None) and (X2 is None):
@@ -310,19 +424,19 @@ class StreamProcessor(threading.Thread):
             # We only have a far point
             # Not great, but we will use it
             isGood = True
-            offset = ((2.0 * X2) / Settings.scaledWidth) - 1.0
+            offset = ((2.0 * X2) / self.scaledWidth) - 1.0
             change = 0.0
         elif X2 is None:
             # We only have a near point
             # We loose the change, but offset will be good
             isGood = True
-            offset = ((2.0 * X1) / Settings.scaledWidth) - 1.0
+            offset = ((2.0 * X1) / self.scaledWidth) - 1.0
             change = 0.0
         else:
             # We have both points :)
             isGood = True
-            offset = ((2.0 * X1) / Settings.scaledWidth) - 1.0
-            change = (2.0 * (X2 - X1)) / Settings.scaledWidth
+            offset = ((2.0 * X1) / self.scaledWidth) - 1.0
+            change = (2.0 * (X2 - X1)) / self.scaledWidth
         Settings.controller.nextSample = (isGood, offset, change)
         Settings.controller.event.set()
 
@@ -335,16 +449,24 @@ class ImageCapture(threading.Thread):
 
     # Stream delegation loop
     def run(self):
+        # Camera capture runs at Tier 2 priority (ADR-008)
+        if scheduling is not None:
+            scheduling.set_thread_priority(scheduling.TIER2_PRIORITY)
+        # These objects are fixed once the threads are running, bind them
+        # to locals so the 30 Hz loop skips the module attribute lookups
+        frameLock = Settings.frameLock
+        processorPool = Settings.processorPool
+        captureRead = Settings.capture.read
         while Settings.running:
             # Grab the oldest unused processor thread
-            with Settings.frameLock:
-                if Settings.processorPool:
-                    processor = Settings.processorPool.pop()
+            with frameLock:
+                if processorPool:
+                    processor = processorPool.pop()
                 else:
                     processor = None
             if processor:
                 # Grab the next frame and send it to the processor
-                ret, frame = Settings.capture.read()
+                ret, frame = captureRead()
                 if ret:
                     processor.nextFrame = frame.copy()
                     processor.event.set()
@@ -25,7 +25,13 @@ else:
     maxPower = Settings.voltageOut / float(Settings.voltageIn)
 
 showFrameDelay = 1.0 / Settings.showPerSecond
-waitKeyDelay = int(showFrameDelay * 1000)
+
+# Pick the right resize filter once: area averaging for downscales,
+# bilinear for upscales (bicubic is slower and wrong for shrinking)
+if Settings.scaleFinalImage < 1.0:
+    displayInterpolation = cv2.INTER_AREA
+else:
+    displayInterpolation = cv2.INTER_LINEAR
 
 # Change the current directory to where this script is
 # Security: Use __file__ instead of sys.argv[0] to prevent path manipulation
@@ -63,19 +69,23 @@ else:
         time.sleep(0.5)
     TB.SetLedShowBattery(True)
 
-# Function used by the processing to control the MonsterBorg
+    # Function used by the processing to control the MonsterBorg
+    # Defined here so the board is already initialised and the defaults below bind
 
+    def MonsterMotors(driveLeft, driveRight, _maxPower=maxPower, _setMotor1=TB.SetMotor1, _setMotor2=TB.SetMotor2):
+        """
+        Set left and right motor outputs on the ThunderBorg scaled by `maxPower`.
 
-def MonsterMotors(driveLeft, driveRight):
-    """
-    Set left and right motor outputs on the ThunderBorg scaled by the module-level `maxPower`.
+        The power limit and the board's motor methods are bound as default
+        arguments at definition time, so each call reads fast locals instead of
+        chasing module globals and attributes.
 
-    Parameters:
-        driveLeft (float): Scalar applied to the left motors; multiplied by `maxPower` before being sent to the controller.
-        driveRight (float): Scalar applied to the right motors; multiplied by `maxPower` before being sent to the controller.
-    """
-    TB.SetMotor1(driveRight * maxPower)  # Right side motors
-    TB.SetMotor2(driveLeft * maxPower)  # Left side motors
+        Parameters:
+            driveLeft (float): Scalar applied to the left motors; multiplied by `maxPower` before being sent to the controller.
+            driveRight (float): Scalar applied to the right motors; multiplied by `maxPower` before being sent to the controller.
+        """
+        _setMotor1(driveRight * _maxPower)  # Right side motors
+        _setMotor2(driveLeft * _maxPower)  # Left side motors
 
 
 # Function used by the processing for motor output in test mode
@@ -104,6 +114,40 @@ def TestModeMotors(driveLeft, driveRight):
         print("MOTORS: %+07.2f %% left, %+07.2f %% right" % (driveLeft, driveRight))
 
 
+# Dedicated display thread
+# Owns the OpenCV window so the main thread only has to wait for shutdown
+
+
+class Displayer(threading.Thread):
+    def __init__(self):
+        super(Displayer, self).__init__()
+        self.terminated = False
+        self.start()
+
+    def run(self):
+        # This method runs in a separate thread
+        # (safe on Linux; some platforms require GUI calls on the main thread)
+        cv2.namedWindow("Monster view", cv2.WINDOW_NORMAL)
+        while not self.terminated:
+            # Wait for a new frame, or the interval period at most
+            if Settings.displayEvent.wait(showFrameDelay):
+                Settings.displayEvent.clear()
+            monsterView = Settings.displayFrame
+            if monsterView is None:
+                continue
+            if Settings.scaleFinalImage != 1.0:
+                size = (
+                    int(monsterView.shape[1] * Settings.scaleFinalImage),
+                    int(monsterView.shape[0] * Settings.scaleFinalImage),
+                )
+                monsterView = cv2.resize(monsterView, size, interpolation=displayInterpolation)
+            cv2.imshow("Monster view", monsterView)
+            # pollKey pumps the GUI events without blocking; the frame
+            # pacing comes from the event wait above, not from waitKey
+            cv2.pollKey()
+        cv2.destroyAllWindows()
+
+
 # Push the appropriate motor function into the settings module
 if Settings.testMode:
     Settings.MonsterMotors = TestModeMotors
@@ -127,6 +171,9 @@ Settings.capture = cv2.VideoCapture(0)
 Settings.capture.set(cv2.CAP_PROP_FRAME_WIDTH, Settings.cameraWidth)
 Settings.capture.set(cv2.CAP_PROP_FRAME_HEIGHT, Settings.cameraHeight)
 Settings.capture.set(cv2.CAP_PROP_FPS, Settings.frameRate)
+# Keep only one frame queued in the V4L2 driver so the processors always
+# see the newest image instead of one delayed by several buffered frames
+Settings.capture.set(cv2.CAP_PROP_BUFFERSIZE, 1)
 if not Settings.capture.isOpened():
     Settings.capture.open()
     if not Settings.capture.isOpened():
@@ -135,38 +182,27 @@ if not Settings.capture.isOpened():
 
 print("Setup stream processor threads")
 Settings.frameLock = threading.Lock()
+Settings.displayEvent = threading.Event()
 Settings.processorPool = [ImageProcessor.StreamProcessor(i + 1) for i in range(Settings.processingThreads)]
 allProcessors = Settings.processorPool[:]
 
 print("Setup control loop")
-Settings.controller = ImageProcessor.ControlLoop()
+Settings.controller = ImageProcessor.ControlLoop(motorFn=Settings.MonsterMotors)
 
 print("Wait ...")
 time.sleep(2)
 captureThread = ImageProcessor.ImageCapture()
 
+displayThread = None
 try:
     print("Press CTRL+C to quit")
     Settings.MonsterMotors(0, 0)
-    # Create a window to show images if we need one
+    # Start the display thread if we need one
     if Settings.showImages:
-        cv2.namedWindow("Monster view", cv2.WINDOW_NORMAL)
-    # Loop indefinitely
+        displayThread = Displayer()
+    # Loop indefinitely, the display thread handles any frames
     while Settings.running:
-        # See if there is a frame to show, wait either way
-        monsterView = Settings.displayFrame
-        if monsterView is not None:
-            if Settings.scaleFinalImage != 1.0:
-                size = (
-                    int(monsterView.shape[1] * Settings.scaleFinalImage),
-                    int(monsterView.shape[0] * Settings.scaleFinalImage),
-                )
-                monsterView = cv2.resize(monsterView, size, interpolation=cv2.INTER_CUBIC)
-            cv2.imshow("Monster view", monsterView)
-            cv2.waitKey(waitKeyDelay)
-        else:
-            # Wait for the interval period
-            time.sleep(showFrameDelay)
+        time.sleep(0.5)
     # Disable all drives
     Settings.MonsterMotors(0, 0)
 except KeyboardInterrupt:
@@ -181,6 +217,10 @@ except Exception as e:
     Settings.MonsterMotors(0, 0)
 # Tell each thread to stop, and wait for them to end
 Settings.running = False
+if displayThread is not None:
+    displayThread.terminated = True
+    Settings.displayEvent.set()
+    displayThread.join()
 while allProcessors:
     with Settings.frameLock:
         processor = allProcessors.pop()
@@ -78,6 +78,7 @@ MonsterMotors = None  # Function which runs the MonsterBorg motors
 
 # Shared data
 displayFrame = None  # Image to show when running (if any)
+displayEvent = None  # Set when a new displayFrame is ready
 frameCounter = 0  # Shared index for each frame coming in
 frameAnnounce = 0  # Wrapping counter for FPS display
 lastFrameStamp = 0  # Time stamp used for measuring FPS
@@ -8,11 +8,10 @@ import ThunderBorg
 import time
 import sys
 import os
+import io
 import threading
 import socketserver
 import picamera
-import picamera.array
-import cv2
 import datetime
 
 # Settings for the web-page
@@ -30,7 +29,6 @@ jpegQuality = 80  # JPEG quality level, smaller is faster, higher looks better (
 # Global values (no need for global declaration at module level)
 running = True
 lastFrame = None
-lockFrame = None
 camera = None
 processor = None
 watchdog = None
@@ -97,380 +95,372 @@ class Watchdog(threading.Thread):
                     TB.MotorsOff()
 
 
-# Image stream processing thread
-class StreamProcessor(threading.Thread):
+# Output object the camera recorder writes hardware-encoded frames into
+class JpegStreamBuffer(object):
     def __init__(self):
         """
-        Initialize the StreamProcessor thread and prepare its camera buffer and control flags.
+        Initialize the buffer the camera's MJPEG recording is written to.
 
-        Sets up:
-        - `stream`: a PiRGBArray bound to the module-level `camera` for receiving frames.
-        - `event`: threading.Event used to signal when a new frame is available for processing.
-        - `terminated`: boolean flag (False) indicating the thread should continue running.
-        - `begin`: numeric counter initialized to 0.
-
-        The constructor also starts the thread so it begins processing when signaled.
+        Sets up `buffer`, an in-memory BytesIO that accumulates the bytes of the
+        frame currently being delivered by the encoder.
         """
-        super(StreamProcessor, self).__init__()
-        self.stream = picamera.array.PiRGBArray(camera)  # noqa: F821
-        self.event = threading.Event()
-        self.terminated = False
-        self.start()
-        self.begin = 0
+        self.buffer = io.BytesIO()
 
-    def run(self):
-        """
-        Continuously waits for frames, encodes the latest camera frame to JPEG, and updates
-        the module-global `lastFrame`.
-
-        While `self.terminated` is False, waits up to one second for `self.event` to be set.
-        When set, reads the current frame from `self.stream`, optionally flips it according
-        to `flippedCamera`, encodes it to JPEG with `jpegQuality`, and replaces the
-        module-global `lastFrame` while holding `lockFrame`. After processing, resets the
-        stream and clears the event.
+    def write(self, buf):
         """
-        global lastFrame  # Assigned when frame changes
-        # This method runs in a separate thread
-        while not self.terminated:
-            # Wait for an image to be written to the stream
-            if self.event.wait(1):
-                try:
-                    # Read the image and save globally
-                    self.stream.seek(0)
-                    if flippedCamera:
-                        flippedArray = cv2.flip(self.stream.array, -1)  # Flips X and Y
-                        retval, thisFrame = cv2.imencode(".jpg", flippedArray, [cv2.IMWRITE_JPEG_QUALITY, jpegQuality])
-                        if not retval:
-                            continue  # Skip this frame
-                        del flippedArray
-                    else:
-                        retval, thisFrame = cv2.imencode(".jpg", self.stream.array, [cv2.IMWRITE_JPEG_QUALITY, jpegQuality])
-                        if not retval:
-                            continue  # Skip this frame
-
-                    # updated to resolve a possible concurrency bug.
-                    # Use a context manager to guarantee the lock is always released
-                    with lockFrame:
-                        lastFrame = thisFrame
-                finally:
-                    # Reset the stream and event
-                    self.stream.seek(0)
-                    self.stream.truncate()
-                    self.event.clear()
-
-
-# Image capture thread
-class ImageCapture(threading.Thread):
-    def __init__(self):
-        """
-        Initialize the ImageCapture thread and start it.
+        Receive encoded bytes from the camera and publish each complete JPEG.
 
-        Creates the thread instance responsible for driving the camera capture loop and
-        begins its execution immediately.
+        The recorder calls this from its own thread. A new frame starts with the
+        JPEG SOI marker (0xFFD8); when one arrives the previous frame is complete,
+        so its bytes are swapped into the module-global `lastFrame` (a single
+        reference assignment, atomic under the GIL) and waiting clients are woken
+        via `frameEvent`.
         """
-        super(ImageCapture, self).__init__()
-        self.start()
-
-    def run(self):
-        # camera and processor are read-only, no global needed
-        """
-        Capture a continuous video stream from the camera and coordinate shutdown of the
-        frame processor.
-
-        Starts camera capture using the camera's video port; when capture completes, marks
-        the processor as terminated and waits for the processor thread to finish.
-        """
-        print("Start the stream using the video port")
-        camera.capture_sequence(self.TriggerStream(), format="bgr", use_video_port=True)  # noqa: F821
-        print("Terminating camera processing...")
-        processor.terminated = True
-        processor.join()
-        print("Processing terminated.")
-
-    # Stream delegation loop
-    def TriggerStream(self):
-        # running and processor are read-only, no global needed
-        """
-        Provide a generator for the camera capture loop that yields the processor's frame
-        buffer whenever the processor is ready.
-
-        Returns:
-            generator: Yields the current `processor.stream` object each time a new frame
-            buffer should be captured while the module-level `running` flag is True.
-        """
-        while running:
-            if processor.event.is_set():
-                time.sleep(0.01)
-            else:
-                yield processor.stream
-                processor.event.set()
+        global lastFrame  # Assigned when frame changes
+        if buf.startswith(b"\xff\xd8") and self.buffer.tell() > 0:
+            # Start of a new frame, so the buffered one is complete
+            lastFrame = self.buffer.getvalue()
+            frameEvent.set()
+            self.buffer.seek(0)
+            self.buffer.truncate()
+        return self.buffer.write(buf)
+
+
+# Pre-built web pages
+# The pages only depend on startup settings, so build each complete
+# HTTP response once as bytes instead of re-assembling it per request
+
+
+def BuildResponse(content):
+    """
+    Wrap a page body in a complete HTTP/1.1 keep-alive response.
+
+    Parameters:
+        content (bytes or str): The response body; strings are UTF-8 encoded.
+
+    Returns:
+        bytes: The full response including Content-Length and Connection headers.
+    """
+    if isinstance(content, str):
+        content = content.encode("utf-8")
+    header = b"HTTP/1.1 200 OK\r\nContent-Length: %d\r\nConnection: keep-alive\r\n\r\n" % len(content)
+    return header + content
+
+
+def BuildDrivePage(holdButtons):
+    """
+    Build the HTML for the main control page.
+
+    Parameters:
+        holdButtons (bool): False for the click-to-drive page (/), True for the
+        hold-to-drive variant (/hold) where releasing a button stops the robot.
+
+    Returns:
+        str: The complete HTML page.
+    """
+    if holdButtons:
+        driveButton = (
+            '<button onmousedown="Drive(%d,%d)" onmouseup="Off()" style="width:200px;height:100px;"><b>%s</b></button>\n'
+        )
+    else:
+        driveButton = '<button onclick="Drive(%d,%d)" style="width:200px;height:100px;"><b>%s</b></button>\n'
+    httpText = "<html>\n"
+    httpText += "<head>\n"
+    httpText += '<script language="JavaScript"><!--\n'
+    httpText += "function Drive(left, right) {\n"
+    httpText += ' var iframe = document.getElementById("setDrive");\n'
+    httpText += ' var slider = document.getElementById("speed");\n'
+    httpText += " left *= speed.value / 100.0;"
+    httpText += " right *= speed.value / 100.0;"
+    httpText += ' iframe.src = "/set/" + left + "/" + right;\n'
+    httpText += "}\n"
+    httpText += "function Off() {\n"
+    httpText += ' var iframe = document.getElementById("setDrive");\n'
+    httpText += ' iframe.src = "/off";\n'
+    httpText += "}\n"
+    httpText += "function Photo() {\n"
+    httpText += ' var iframe = document.getElementById("setDrive");\n'
+    httpText += ' iframe.src = "/photo";\n'
+    httpText += "}\n"
+    httpText += "//--></script>\n"
+    httpText += "</head>\n"
+    httpText += "<body>\n"
+    httpText += '<iframe src="/stream" width="100%" height="500" frameborder="0"></iframe>\n'
+    httpText += '<iframe id="setDrive" src="/off" width="100%" height="50" frameborder="0"></iframe>\n'
+    httpText += "<center>\n"
+    httpText += driveButton % (-1, 1, "Spin Left")
+    httpText += driveButton % (1, 1, "Forward")
+    httpText += driveButton % (1, -1, "Spin Right")
+    httpText += "<br /><br />\n"
+    httpText += driveButton % (0, 1, "Turn Left")
+    httpText += driveButton % (-1, -1, "Reverse")
+    httpText += driveButton % (1, 0, "Turn Right")
+    httpText += "<br /><br />\n"
+    if not holdButtons:
+        httpText += '<button onclick="Off()" style="width:200px;height:100px;"><b>Stop</b></button>\n'
+        httpText += "<br /><br />\n"
+    httpText += '<button onclick="Photo()" style="width:200px;height:100px;"><b>Save Photo</b></button>\n'
+    httpText += "<br /><br />\n"
+    httpText += '<input id="speed" type="range" min="0" max="100" value="100" style="width:600px" />\n'
+    httpText += "</center>\n"
+    httpText += "</body>\n"
+    httpText += "</html>\n"
+    return httpText
+
+
+def BuildStreamPage():
+    """
+    Build the HTML for the streaming page.
+
+    The camera view is a single MJPEG stream pushed by /mjpeg, so the page
+    needs no refresh script.
+
+    Returns:
+        str: The complete HTML page.
+    """
+    httpText = "<html>\n"
+    httpText += "<body>\n"
+    httpText += '<center><img src="/mjpeg" style="width:600;height:480;" name="rpicam" /></center>\n'
+    httpText += "</body>\n"
+    httpText += "</html>\n"
+    return httpText
+
+
+pageMain = BuildResponse(BuildDrivePage(False))
+pageHold = BuildResponse(BuildDrivePage(True))
+pageStream = BuildResponse(BuildStreamPage())
+pageOff = BuildResponse(b"<html><body><center>Speeds: 0 %, 0 %</center></body></html>")
+setResponseTemplate = "<html><body><center>Speeds: %.0f %%, %.0f %%</center></body></html>"
 
 
 # Class used to implement the web server
 class WebServer(socketserver.BaseRequestHandler):
+    # Cap on buffered header bytes; anything larger is not a sane GET
+    MAX_HEADER_SIZE = 8192
+
     def handle(self):
-        # TB, lastFrame, lockFrame, watchdog are read-only, no global needed
+        # TB, lastFrame, watchdog are read-only, no global needed
         # Get the HTTP request data
         """
-        Handle a single incoming HTTP request and respond to camera, motor, and control
-        endpoints.
-
-        Processes the raw HTTP request from the connection and routes based on the request
-        path. Supported behaviors include:
-        - Serving the latest camera JPEG (/cam.jpg).
-        - Stopping motors (/off) and setting motor power (/set/<left>/<right>).
-        - Saving a timestamped photo to the configured photo directory (/photo) with path
-          validation and error handling.
-        - Serving the main control pages (/, /hold) and the streaming page (/stream).
-        This method also signals activity to the watchdog, reads the current frame under
-        lock, and may change motor state or write files as described.
+        Handle a single incoming HTTP request and dispatch it to the right route handler.
+
+        Parses the request path out of the raw HTTP request, signals activity to the
+        watchdog, then looks up the handler for the first path segment in ROUTES.
+        Unknown paths fall through to HandleUnknown.
         """
-        reqData = self.request.recv(1024).strip()
-        reqData = reqData.decode("utf-8").split("\n")
-        # Get the URL requested
-        getPath = ""
-        for line in reqData:
-            if line.startswith("GET"):
-                parts = line.split(" ")
-                getPath = parts[1]
-                break
-        watchdog.event.set()
-        if getPath.startswith("/cam.jpg"):
-            # Camera snapshot
-            with lockFrame:
-                sendFrame = lastFrame
-            if sendFrame is not None:
-                self.send(sendFrame.tobytes())
-        elif getPath.startswith("/off"):
-            # Turn the drives off
-            httpText = "<html><body><center>"
-            httpText += "Speeds: 0 %, 0 %"
-            httpText += "</center></body></html>"
-            self.send(httpText)
-            TB.MotorsOff()
-        elif getPath.startswith("/set/"):
-            # Motor power setting: /set/driveLeft/driveRight
-            parts = getPath.split("/")
-            # Get the power levels
-            if len(parts) >= 4:
+        # Keep the connection open so the stream page can reuse it for
+        # repeated /cam.jpg polls instead of a TCP handshake per frame
+        buffer = b""
+        while running:
+            # TCP gives no message framing: one recv can hold a partial
+            # request or more than one, so buffer until the header block
+            # terminator before dispatching
+            terminator = buffer.find(b"\r\n\r\n")
+            if terminator < 0:
+                if len(buffer) > self.MAX_HEADER_SIZE:
+                    # Oversized or malformed header block, give up
+                    break
                 try:
-                    driveLeft = float(parts[2])
-                    driveRight = float(parts[3])
-                except (ValueError, TypeError):
-                    # Bad values
-                    driveRight = 0.0
-                    driveLeft = 0.0
+                    reqData = self.request.recv(1024)
+                except (ConnectionError, OSError):
+                    break
+                if not reqData:
+                    # Client closed the connection
+                    break
+                buffer += reqData
+                continue
+            # Split off this request; bytes past the terminator belong to
+            # the next request on the connection (GET requests have no body)
+            header = buffer[:terminator]
+            buffer = buffer[terminator + 4 :]
+            # The request line is always first, so only decode the path itself
+            # rather than the whole header block
+            requestLine = header.partition(b"\r\n")[0]
+            parts = requestLine.split(b" ")
+            if len(parts) >= 2 and parts[0] == b"GET":
+                getPath = parts[1].decode("ascii", "replace")
             else:
-                # Bad request
+                getPath = ""
+            watchdog.event.set()
+            # Route on the first path segment (ignoring any query string)
+            segment = getPath.lstrip("/").split("/", 1)[0].split("?", 1)[0]
+            handler = self.ROUTES.get(segment, WebServer.HandleUnknown)
+            handler(self, getPath)
+
+    def HandleCamera(self, getPath):
+        # Camera snapshot, grab the current frame reference (atomic read)
+        sendFrame = lastFrame
+        if sendFrame is not None:
+            self.send(sendFrame)
+
+    def HandleOff(self, getPath):
+        # Turn the drives off
+        self.request.sendall(pageOff)
+        TB.MotorsOff()
+
+    def HandleSet(self, getPath):
+        # Motor power setting: /set/driveLeft/driveRight
+        parts = getPath.split("/")
+        # Get the power levels
+        if len(parts) >= 4:
+            try:
+                driveLeft = float(parts[2])
+                driveRight = float(parts[3])
+            except (ValueError, TypeError):
+                # Bad values
                 driveRight = 0.0
                 driveLeft = 0.0
-            # Ensure settings are within limits
-            if driveRight < -1:
-                driveRight = -1
-            elif driveRight > 1:
-                driveRight = 1
-            if driveLeft < -1:
-                driveLeft = -1
-            elif driveLeft > 1:
-                driveLeft = 1
-            # Report the current settings
-            percentLeft = driveLeft * 100.0
-            percentRight = driveRight * 100.0
-            httpText = "<html><body><center>"
-            httpText += "Speeds: %.0f %%, %.0f %%" % (percentLeft, percentRight)
-            httpText += "</center></body></html>"
-            self.send(httpText)
-            # Set the outputs
-            driveLeft *= maxPower
-            driveRight *= maxPower
-            TB.SetMotor1(driveRight)
-            TB.SetMotor2(driveLeft)
-        elif getPath.startswith("/photo"):
-            # Save camera photo
-            with lockFrame:
-                captureFrame = lastFrame
-            httpText = "<html><body><center>"
-            if captureFrame is not None:
-                # Security: Create safe photo path and ensure directory exists
+        else:
+            # Bad request
+            driveRight = 0.0
+            driveLeft = 0.0
+        # Ensure settings are within limits
+        if driveRight < -1:
+            driveRight = -1
+        elif driveRight > 1:
+            driveRight = 1
+        if driveLeft < -1:
+            driveLeft = -1
+        elif driveLeft > 1:
+            driveLeft = 1
+        # Report the current settings
+        percentLeft = driveLeft * 100.0
+        percentRight = driveRight * 100.0
+        self.send(setResponseTemplate % (percentLeft, percentRight))
+        # Set the outputs
+        driveLeft *= maxPower
+        driveRight *= maxPower
+        TB.SetMotor1(driveRight)
+        TB.SetMotor2(driveLeft)
+
+    def HandlePhoto(self, getPath):
+        # Save camera photo, grab the current frame reference (atomic read)
+        captureFrame = lastFrame
+        httpText = "<html><body><center>"
+        if captureFrame is not None:
+            # Security: Create safe photo path and ensure directory exists
+            try:
+                # Ensure photo directory exists
+                os.makedirs(photoDirectory, exist_ok=True)
+                # Create safe filename
+                filename = "Photo_%s.jpg" % datetime.datetime.utcnow().strftime("%Y%m%d_%H%M%S")
+                # realpath on both sides so a symlinked photo directory
+                # (e.g. pointing at removable media) still prefix-matches
+                base_dir = os.path.realpath(photoDirectory)
+                photoName = os.path.join(base_dir, filename)
+                # Validate path is within photoDirectory (prevent path traversal)
+                # The filename comes from strftime, so a simple resolved-prefix
+                # check is enough and cheaper than commonpath
+                if not os.path.realpath(photoName).startswith(base_dir + os.sep):
+                    raise ValueError("Invalid photo path")
+                # Save photo
+                # Write through a raw descriptor to skip the buffered file
+                # object; O_EXCL makes any name collision an explicit error
+                fd = os.open(photoName, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644)
                 try:
-                    # Ensure photo directory exists
-                    os.makedirs(photoDirectory, exist_ok=True)
-                    # Create safe filename
-                    filename = "Photo_%s.jpg" % datetime.datetime.utcnow().strftime("%Y%m%d_%H%M%S")
-                    base_dir = os.path.abspath(photoDirectory)
-                    photoName = os.path.join(base_dir, filename)
-                    # Validate path is within photoDirectory (prevent path traversal)
-                    # Use os.path.commonpath for robust containment check
-                    if os.path.commonpath([photoName, base_dir]) != base_dir:
-                        raise ValueError("Invalid photo path")
-                    # Save photo
-                    photoFile = open(photoName, "wb")
-                    photoFile.write(captureFrame)
-                    photoFile.close()
-                    httpText += "Photo saved to %s" % (photoName)
-                except (IOError, OSError, ValueError) as e:
-                    # Security: Use specific exceptions and don't expose details to user
-                    httpText += "Failed to take photo!"
-                    print("Photo save error: %s" % str(e))
-            else:
+                    os.write(fd, captureFrame)
+                finally:
+                    os.close(fd)
+                httpText += "Photo saved to %s" % (photoName)
+            except (IOError, OSError, ValueError) as e:
+                # Security: Use specific exceptions and don't expose details to user
                 httpText += "Failed to take photo!"
-            httpText += "</center></body></html>"
-            self.send(httpText)
-        elif getPath == "/":
-            # Main page, click buttons to move and to stop
-            httpText = "<html>\n"
-            httpText += "<head>\n"
-            httpText += '<script language="JavaScript"><!--\n'
-            httpText += "function Drive(left, right) {\n"
-            httpText += ' var iframe = document.getElementById("setDrive");\n'
-            httpText += ' var slider = document.getElementById("speed");\n'
-            httpText += " left *= speed.value / 100.0;"
-            httpText += " right *= speed.value / 100.0;"
-            httpText += ' iframe.src = "/set/" + left + "/" + right;\n'
-            httpText += "}\n"
-            httpText += "function Off() {\n"
-            httpText += ' var iframe = document.getElementById("setDrive");\n'
-            httpText += ' iframe.src = "/off";\n'
-            httpText += "}\n"
-            httpText += "function Photo() {\n"
-            httpText += ' var iframe = document.getElementById("setDrive");\n'
-            httpText += ' iframe.src = "/photo";\n'
-            httpText += "}\n"
-            httpText += "//--></script>\n"
-            httpText += "</head>\n"
-            httpText += "<body>\n"
-            httpText += '<iframe src="/stream" width="100%" height="500" frameborder="0"></iframe>\n'
-            httpText += '<iframe id="setDrive" src="/off" width="100%" height="50" frameborder="0"></iframe>\n'
-            httpText += "<center>\n"
-            httpText += '<button onclick="Drive(-1,1)" style="width:200px;height:100px;"><b>Spin Left</b></button>\n'
-            httpText += '<button onclick="Drive(1,1)" style="width:200px;height:100px;"><b>Forward</b></button>\n'
-            httpText += '<button onclick="Drive(1,-1)" style="width:200px;height:100px;"><b>Spin Right</b></button>\n'
-            httpText += "<br /><br />\n"
-            httpText += '<button onclick="Drive(0,1)" style="width:200px;height:100px;"><b>Turn Left</b></button>\n'
-            httpText += '<button onclick="Drive(-1,-1)" style="width:200px;height:100px;"><b>Reverse</b></button>\n'
-            httpText += '<button onclick="Drive(1,0)" style="width:200px;height:100px;"><b>Turn Right</b></button>\n'
-            httpText += "<br /><br />\n"
-            httpText += '<button onclick="Off()" style="width:200px;height:100px;"><b>Stop</b></button>\n'
-            httpText += "<br /><br />\n"
-            httpText += '<button onclick="Photo()" style="width:200px;height:100px;"><b>Save Photo</b></button>\n'
-            httpText += "<br /><br />\n"
-            httpText += '<input id="speed" type="range" min="0" max="100" value="100" style="width:600px" />\n'
-            httpText += "</center>\n"
-            httpText += "</body>\n"
-            httpText += "</html>\n"
-            self.send(httpText)
-        elif getPath == "/hold":
-            # Alternate page, hold buttons to move (does not work with all devices)
-            httpText = "<html>\n"
-            httpText += "<head>\n"
-            httpText += '<script language="JavaScript"><!--\n'
-            httpText += "function Drive(left, right) {\n"
-            httpText += ' var iframe = document.getElementById("setDrive");\n'
-            httpText += ' var slider = document.getElementById("speed");\n'
-            httpText += " left *= speed.value / 100.0;"
-            httpText += " right *= speed.value / 100.0;"
-            httpText += ' iframe.src = "/set/" + left + "/" + right;\n'
-            httpText += "}\n"
-            httpText += "function Off() {\n"
-            httpText += ' var iframe = document.getElementById("setDrive");\n'
-            httpText += ' iframe.src = "/off";\n'
-            httpText += "}\n"
-            httpText += "function Photo() {\n"
-            httpText += ' var iframe = document.getElementById("setDrive");\n'
-            httpText += ' iframe.src = "/photo";\n'
-            httpText += "}\n"
-            httpText += "//--></script>\n"
-            httpText += "</head>\n"
-            httpText += "<body>\n"
-            httpText += (
-                '<iframe src="/stream" width="100%" height="500" '
-                'frameborder="0"></iframe>\n'
-            )
-            httpText += (
-                '<iframe id="setDrive" src="/off" width="100%" height="50" '
-                'frameborder="0"></iframe>\n'
-            )
-            httpText += "<center>\n"
-            httpText += (
-                '<button onmousedown="Drive(-1,1)" onmouseup="Off()" '
-                'style="width:200px;height:100px;"><b>Spin Left</b></button>\n'
-            )
-            httpText += (
-                '<button onmousedown="Drive(1,1)" onmouseup="Off()" '
-                'style="width:200px;height:100px;"><b>Forward</b></button>\n'
-            )
-            httpText += (
-                '<button onmousedown="Drive(1,-1)" onmouseup="Off()" '
-                'style="width:200px;height:100px;"><b>Spin Right</b></button>\n'
-            )
-            httpText += "<br /><br />\n"
-            httpText += (
-                '<button onmousedown="Drive(0,1)" onmouseup="Off()" '
-                'style="width:200px;height:100px;"><b>Turn Left</b></button>\n'
-            )
-            httpText += (
-                '<button onmousedown="Drive(-1,-1)" onmouseup="Off()" '
-                'style="width:200px;height:100px;"><b>Reverse</b></button>\n'
-            )
-            httpText += (
-                '<button onmousedown="Drive(1,0)" onmouseup="Off()" '
-                'style="width:200px;height:100px;"><b>Turn Right</b></button>\n'
-            )
-            httpText += "<br /><br />\n"
-            httpText += '<button onclick="Photo()" style="width:200px;height:100px;"><b>Save Photo</b></button>\n'
-            httpText += "<br /><br />\n"
-            httpText += '<input id="speed" type="range" min="0" max="100" value="100" style="width:600px" />\n'
-            httpText += "</center>\n"
-            httpText += "</body>\n"
-            httpText += "</html>\n"
-            self.send(httpText)
-        elif getPath == "/stream":
-            # Streaming frame, set a delayed refresh
-            displayDelay = int(1000 / displayRate)
-            httpText = "<html>\n"
-            httpText += "<head>\n"
-            httpText += '<script language="JavaScript"><!--\n'
-            httpText += "function refreshImage() {\n"
-            httpText += " if (!document.images) return;\n"
-            httpText += ' document.images["rpicam"].src = "cam.jpg?" + Math.random();\n'
-            httpText += ' setTimeout("refreshImage()", %d);\n' % (displayDelay)
-            httpText += "}\n"
-            httpText += "//--></script>\n"
-            httpText += "</head>\n"
-            httpText += "<body onLoad=\"setTimeout('refreshImage()', %d)\">\n" % (displayDelay)
-            httpText += '<center><img src="/cam.jpg" style="width:600;height:480;" name="rpicam" /></center>\n'
-            httpText += "</body>\n"
-            httpText += "</html>\n"
-            self.send(httpText)
+                print("Photo save error: %s" % str(e))
         else:
-            # Unexpected page
-            self.send('Path : "%s"' % (getPath))
+            httpText += "Failed to take photo!"
+        httpText += "</center></body></html>"
+        self.send(httpText)
+
+    def HandleMain(self, getPath):
+        # Main page, click buttons to move and to stop
+        self.request.sendall(pageMain)
+
+    def HandleHold(self, getPath):
+        # Alternate page, hold buttons to move (does not work with all devices)
+        self.request.sendall(pageHold)
+
+    def HandleStream(self, getPath):
+        # Streaming frame, set a delayed refresh
+        self.request.sendall(pageStream)
+
+    def HandleMjpeg(self, getPath):
+        # Continuous MJPEG stream: push each new frame over this connection
+        # instead of having the client poll /cam.jpg
+        header = b"HTTP/1.1 200 OK\r\nContent-Type: multipart/x-mixed-replace;boundary=frame\r\nConnection: close\r\n\r\n"
+        try:
+            self.request.sendall(header)
+            while running:
+                # Wait for the next frame to be published
+                if not frameEvent.wait(1):
+                    continue
+                frameEvent.clear()
+                sendFrame = lastFrame
+                if sendFrame is None:
+                    continue
+                part = b"--frame\r\nContent-Type: image/jpeg\r\nContent-Length: %d\r\n\r\n" % len(sendFrame)
+                self.request.sendall(part)
+                self.request.sendall(sendFrame)
+                self.request.sendall(b"\r\n")
+        except (ConnectionError, OSError):
+            # Client went away, end the stream quietly
+            pass
+
+    def HandleUnknown(self, getPath):
+        # Unexpected page
+        self.send('Path : "%s"' % (getPath))
+
+    # Constant-time dispatch on the first path segment
+    ROUTES = {
+        "cam.jpg": HandleCamera,
+        "off": HandleOff,
+        "set": HandleSet,
+        "photo": HandlePhoto,
+        "mjpeg": HandleMjpeg,
+        "": HandleMain,
+        "hold": HandleHold,
+        "stream": HandleStream,
+    }
 
     def send(self, content):
-        if isinstance(content, bytes):
-            h_head = b"HTTP/1.0 200 OK\n\n" + content
-        elif isinstance(content, str):
-            h_head = b"HTTP/1.0 200 OK\n\n" + content.encode("utf-8")
-        self.request.sendall(h_head)
-        # self.request.sendall('HTTP/1.0 200 OK\n\n%s' % (content.encode('utf-8')))
+        # Send the header and body as separate buffers rather than
+        # concatenating them, which would copy the whole JPEG payload
+        # into a fresh bytes object on every /cam.jpg response
+        if isinstance(content, str):
+            content = content.encode("utf-8")
+        header = b"HTTP/1.1 200 OK\r\nContent-Length: %d\r\nConnection: keep-alive\r\n\r\n" % len(content)
+        self.request.sendall(header)
+        self.request.sendall(content)
+
+
+# Threaded TCP server so camera polls and drive commands progress in parallel
+class ThreadedWebServer(socketserver.ThreadingMixIn, socketserver.TCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
 
 
 # Create the image buffer frame
+# lastFrame is published by plain reference assignment, which is atomic
+# under the GIL, so no lock is needed around it
 lastFrame = None
-lockFrame = threading.Lock()
+frameEvent = threading.Event()
 
 # Startup sequence
 print("Setup camera")
 camera = picamera.PiCamera()
 camera.resolution = (imageWidth, imageHeight)
 camera.framerate = frameRate
-
-print("Setup the stream processing thread")
-processor = StreamProcessor()
+if flippedCamera:
+    # Flip both axes at the sensor readout (equivalent to a 180 degree
+    # rotation) so the frames arrive pre-rotated for free
+    camera.hflip = True
+    camera.vflip = True
 
 print("Wait ...")
 time.sleep(2)
-captureThread = ImageCapture()
+
+print("Start the stream using the hardware MJPEG encoder")
+processor = JpegStreamBuffer()
+camera.start_recording(processor, format="mjpeg", quality=jpegQuality)
 
 print("Setup the watchdog")
 watchdog = Watchdog()
@@ -483,7 +473,7 @@ try:
     if webBindAddress == "0.0.0.0":
         print("WARNING: Server is exposed on ALL network interfaces!")
         print("         This is a SECURITY RISK - consider using localhost or specific IP")
-    httpServer = socketserver.TCPServer((webBindAddress, webPort), WebServer)
+    httpServer = ThreadedWebServer((webBindAddress, webPort), WebServer)
 except (OSError, IOError) as e:
     # Security: Use specific exceptions instead of bare except
     # Failed to open the port, report common issues
@@ -510,10 +500,10 @@ finally:
 if httpServer is not None:
     httpServer.server_close()
 running = False
-captureThread.join()
-processor.terminated = True
+print("Terminating camera processing...")
+camera.stop_recording()
+print("Processing terminated.")
 watchdog.terminated = True
-processor.join()
 watchdog.join()
 del camera
 TB.SetLedShowBattery(False)
@@ -1,5 +1,21 @@
 """Core module for MonsterBorg configuration and main control logic."""
 
+from .scheduling import (
+    TIER1_PRIORITY,
+    TIER2_PRIORITY,
+    TIER3_PRIORITY,
+    set_thread_affinity,
+    set_thread_priority,
+)
 from .settings import ConfigurationError, Settings, load_config
 
-__all__ = ["ConfigurationError", "Settings", "load_config"]
+__all__ = [
+    "ConfigurationError",
+    "Settings",
+    "load_config",
+    "TIER1_PRIORITY",
+    "TIER2_PRIORITY",
+    "TIER3_PRIORITY",
+    "set_thread_affinity",
+    "set_thread_priority",
+]
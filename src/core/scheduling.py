@@ -0,0 +1,189 @@
+# coding: utf-8
+"""Realtime thread scheduling helpers (ADR-008).
+
+ADR-008 defines a three-tier thread priority model, but Python threads
+all run at the default policy unless told otherwise. These helpers give
+a thread a SCHED_FIFO realtime priority (and optionally a CPU affinity)
+so, for example, the web server cannot preempt motor control under load.
+
+SCHED_FIFO needs CAP_SYS_NICE (or root, or a matching rtprio rlimit);
+when that is missing the helpers return False and the thread keeps the
+default policy, so calling them is always safe.
+
+Threading Priority (ADR-008):
+    - Tier 1 (Highest): Motor Control + Safety Monitor
+    - Tier 2 (Medium): Video Streaming + Image Processing
+    - Tier 3 (Lowest): Web Server
+
+See Also:
+    - docs/DECISIONS.md: ADR-008 for threading model
+"""
+
+import heapq
+import itertools
+import logging
+import os
+import threading
+import time
+from typing import Callable, Iterable, Optional
+
+# Module logger
+_logger = logging.getLogger(__name__)
+
+# SCHED_FIFO priorities for the ADR-008 tiers (1 = lowest, 99 = highest)
+TIER1_PRIORITY = 80  # Motor control + safety
+TIER2_PRIORITY = 50  # Camera capture + image processing
+TIER3_PRIORITY = 20  # Web server
+
+__all__ = [
+    "TIER1_PRIORITY",
+    "TIER2_PRIORITY",
+    "TIER3_PRIORITY",
+    "PeriodicScheduler",
+    "set_thread_priority",
+    "set_thread_affinity",
+]
+
+
+class PeriodicScheduler(threading.Thread):
+    """Single-thread dispatcher for periodic tasks.
+
+    Running N periodic monitors as N threads means N wakeups per period
+    and N context switches. This consolidates them: a min-heap of
+    deadlines drives one wait per earliest deadline, and all due
+    callbacks run on this one thread. Give the scheduler the priority
+    tier of its most critical task.
+
+    Callbacks must be short and non-blocking; a slow callback delays
+    every other task on the wheel.
+
+    Example:
+        >>> scheduler = PeriodicScheduler(priority=TIER1_PRIORITY)
+        >>> scheduler.add(check_safety, interval=0.1)
+        >>> scheduler.add(poll_battery, interval=0.5)
+        >>> scheduler.start()
+        >>> # During shutdown:
+        >>> scheduler.terminate()
+        >>> scheduler.join()
+    """
+
+    def __init__(
+        self,
+        priority: Optional[int] = None,
+        name: str = "PeriodicScheduler",
+    ):
+        """Initialize the scheduler.
+
+        Args:
+            priority: Optional TIERn_PRIORITY applied to the dispatch
+                thread on startup
+            name: Thread name
+        """
+        super().__init__(name=name, daemon=True)
+        self._priority = priority
+        self._lock = threading.Lock()
+        # Heap entries: (deadline, sequence, interval, callback); the
+        # sequence breaks ties so callbacks never get compared
+        self._heap: list[tuple[float, int, float, Callable[[], None]]] = []
+        self._counter = itertools.count()
+        self._wake = threading.Event()
+        self._terminated = threading.Event()
+
+    def add(self, callback: Callable[[], None], interval: float) -> None:
+        """Register a callback to run every interval seconds.
+
+        The first invocation happens one interval from now. Safe to call
+        before or after start().
+
+        Args:
+            callback: Zero-argument callable to invoke periodically
+            interval: Seconds between invocations
+        """
+        entry = (
+            time.monotonic() + interval,
+            next(self._counter),
+            interval,
+            callback,
+        )
+        with self._lock:
+            heapq.heappush(self._heap, entry)
+        # A new task may move the earliest deadline forward
+        self._wake.set()
+
+    def terminate(self) -> None:
+        """Signal the scheduler thread to terminate."""
+        self._terminated.set()
+        self._wake.set()
+
+    def run(self) -> None:
+        """Dispatch loop - sleeps until the earliest deadline."""
+        if self._priority is not None:
+            set_thread_priority(self._priority)
+
+        while not self._terminated.is_set():
+            # Clear before scanning the heap: an add() landing any time
+            # after the scan then leaves the event set, so the wait below
+            # returns at once instead of sleeping out a stale timeout
+            self._wake.clear()
+            now = time.monotonic()
+            due: list[Callable[[], None]] = []
+            with self._lock:
+                while self._heap and self._heap[0][0] <= now:
+                    _, seq, interval, callback = heapq.heappop(self._heap)
+                    due.append(callback)
+                    heapq.heappush(self._heap, (now + interval, seq, interval, callback))
+                timeout = self._heap[0][0] - now if self._heap else None
+
+            for callback in due:
+                try:
+                    callback()
+                except Exception:
+                    # One failing task must not take down the wheel
+                    _logger.exception("Periodic task %r failed", callback)
+
+            if not self._terminated.is_set():
+                self._wake.wait(timeout)
+
+
+def set_thread_priority(priority: int) -> bool:
+    """Give the calling thread a SCHED_FIFO realtime priority.
+
+    Call this from the top of a thread's run() method with one of the
+    TIERn_PRIORITY constants.
+
+    Args:
+        priority: SCHED_FIFO priority, 1 (lowest) to 99 (highest)
+
+    Returns:
+        True if the priority was applied, False if the platform does not
+        support it or the process lacks permission
+    """
+    try:
+        # pid 0 targets the calling thread (each thread is a kernel task)
+        os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(priority))
+        return True
+    except AttributeError:
+        # Not a Linux platform
+        return False
+    except (PermissionError, OSError) as e:
+        _logger.debug("Could not set SCHED_FIFO priority %d: %s", priority, e)
+        return False
+
+
+def set_thread_affinity(cores: Iterable[int]) -> bool:
+    """Pin the calling thread to the given CPU cores.
+
+    Args:
+        cores: CPU indices the thread may run on (e.g. {2, 3})
+
+    Returns:
+        True if the affinity was applied, False otherwise
+    """
+    try:
+        os.sched_setaffinity(0, set(cores))
+        return True
+    except AttributeError:
+        return False
+    except OSError as e:
+        _logger.debug("Could not set CPU affinity %s: %s", cores, e)
+        return False
@@ -31,6 +31,13 @@ _CONFIG_DIR = Path(__file__).parent.parent.parent / "config"
 _CONFIG_FILE = _CONFIG_DIR / "config.json"
 _SCHEMA_FILE = _CONFIG_DIR / "config.schema.json"
 
+# Parsed configs keyed on (path, mtime), so repeated loads of an
+# unchanged file (tests, subprocess workers) skip the JSON parse
+_config_cache: Dict[Tuple[Path, int], Dict[str, Any]] = {}
+
+# The default photo directory never changes, expand it once
+_DEFAULT_PHOTO_DIRECTORY = os.path.expanduser("~/monster-photos")
+
 
 class ConfigurationError(Exception):
     """Raised when configuration loading or validation fails."""
@@ -56,6 +63,12 @@ def load_config(config_path: Optional[Path] = None) -> Dict[str, Any]:
     if not config_path.exists():
         raise FileNotFoundError(f"Configuration file not found: {config_path}")
 
+    # Reuse the parsed result while the file is unchanged on disk
+    cache_key = (config_path, config_path.stat().st_mtime_ns)
+    cached = _config_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
     with open(config_path, "r", encoding="utf-8") as f:
         config = json.load(f)
 
@@ -74,6 +87,7 @@ def load_config(config_path: Optional[Path] = None) -> Dict[str, Any]:
         if section not in config:
             raise ConfigurationError(f"Missing required config section: {section}")
 
+    _config_cache[cache_key] = config
     return config
 
 
@@ -256,12 +270,8 @@ class Settings:
             cls.overlayOriginal = config["debug"].get("overlayOriginal", True)
             cls.showPerSecond = config["debug"].get("showPerSecond", 1)
             cls.scaleFinalImage = config["debug"].get("scaleFinalImage", 1.0)
-            cls.targetLine = tuple(
-                config["debug"].get("targetLineColour", [0, 255, 255])
-            )
-            cls.targetPoints = tuple(
-                config["debug"].get("targetPointsColour", [255, 255, 0])
-            )
+            cls.targetLine = tuple(config["debug"].get("targetLineColour", [0, 255, 255]))
+            cls.targetPoints = tuple(config["debug"].get("targetPointsColour", [255, 255, 0]))
             cls.targetPointSize = config["debug"].get("targetPointSize", 3)
             cls.fpsInterval = cls.frameRate
 
@@ -272,9 +282,11 @@ class Settings:
             cls.emergencyStopEnabled = config["safety"]["emergencyStopEnabled"]
 
             # Paths
-            cls.photoDirectory = os.path.expanduser(
-                config.get("paths", {}).get("photoDirectory", "~/monster-photos")
-            )
+            photo_dir = config.get("paths", {}).get("photoDirectory")
+            if photo_dir is None:
+                cls.photoDirectory = _DEFAULT_PHOTO_DIRECTORY
+            else:
+                cls.photoDirectory = os.path.expanduser(photo_dir)
         except KeyError as e:
             raise ConfigurationError(f"Missing required config key: {e}") from e
         except TypeError as e:
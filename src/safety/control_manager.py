@@ -11,27 +11,53 @@ See Also:
 """
 
 import logging
+import queue
 import threading
 import time
+from collections import OrderedDict
 from dataclasses import dataclass
-from enum import Enum
-from typing import Callable, Optional
+from enum import IntEnum
+from typing import Callable, Iterable, Optional
 
 # Module logger
 _logger = logging.getLogger(__name__)
 
+# Bound at import so hot paths skip the module attribute lookup
+_time = time.time
 
-class UserRole(Enum):
-    """Role of a connected user."""
 
-    CONTROLLER = "controller"
-    OBSERVER = "observer"
-    DISCONNECTED = "disconnected"
+class UserRole(IntEnum):
+    """Role of a connected user.
+
+    IntEnum so role compares are C-level integer compares; use the
+    label property where the old string value is needed (wire formats,
+    logging).
+    """
+
+    CONTROLLER = 2
+    OBSERVER = 1
+    DISCONNECTED = 0
+
+    @property
+    def label(self) -> str:
+        """Lowercase string form, matching the former string values."""
+        return self.name.lower()
+
+
+# Members bound at import: a module-global load beats the enum descriptor
+# lookup on every hot-path role compare
+_CONTROLLER = UserRole.CONTROLLER
+_OBSERVER = UserRole.OBSERVER
+_DISCONNECTED = UserRole.DISCONNECTED
 
 
-@dataclass
+@dataclass(slots=True)
 class UserSession:
-    """Represents a connected user session."""
+    """Represents a connected user session.
+
+    Uses slots (no per-instance dict): role and last_activity are mutated
+    in place, so the class stays unfrozen.
+    """
 
     user_id: str
     role: UserRole
@@ -39,6 +65,20 @@ class UserSession:
     last_activity: float
 
 
+@dataclass(frozen=True, slots=True)
+class _Snapshot:
+    """Immutable read-side view of the control state.
+
+    Writers build a fresh snapshot under the lock and publish it with a
+    single reference assignment, which is atomic under the GIL. Readers
+    dereference the snapshot once and never take the lock.
+    """
+
+    active: Optional[str]
+    requester: Optional[str]
+    roles: dict[str, UserRole]
+
+
 class ControlManager:
     """Manages single-user control with observer mode for additional users.
 
@@ -64,6 +104,8 @@ class ControlManager:
         self,
         on_control_change: Optional[Callable[[str, UserRole], None]] = None,
         takeover_timeout: float = 10.0,
+        on_control_changes: Optional[Callable[[list[tuple[str, UserRole]]], None]] = None,
+        async_dispatch: bool = False,
     ):
         """Initialize the control manager.
 
@@ -72,31 +114,67 @@ class ControlManager:
             takeover_timeout: Seconds to wait for takeover confirmation before
                 auto-granting. Note: Auto-takeover is not yet implemented;
                 this parameter is stored for future use.
+            on_control_changes: Batched callback receiving every
+                (user_id, new_role) change from one operation as a single
+                list. When set, it is used instead of on_control_change so
+                multi-change operations (takeover, disconnect promotion)
+                produce one invocation instead of two.
+            async_dispatch: When True, callbacks are queued and invoked on
+                a dedicated daemon dispatcher thread so a slow callback
+                (e.g. WebSocket broadcast) cannot stall the mutating
+                thread. Ordering is preserved by the single consumer.
+                Default False keeps synchronous delivery.
         """
-        self._lock = threading.RLock()
+        # Plain Lock: no method re-enters another under the lock, and
+        # callbacks now run after it is released, so RLock's owner
+        # tracking is unnecessary overhead
+        self._lock = threading.Lock()
         self._sessions: dict[str, UserSession] = {}
+        # FIFO index of observers for O(1) counting and promotion
+        self._observers: OrderedDict[str, None] = OrderedDict()
         self._active_controller: Optional[str] = None
         self._takeover_requester: Optional[str] = None
         # TODO: Implement auto-takeover timer that grants control after timeout
         # if controller doesn't respond to takeover request
         self._takeover_timeout = takeover_timeout
         self._on_control_change = on_control_change
+        self._on_control_changes = on_control_changes
+        self._snapshot = _Snapshot(active=None, requester=None, roles={})
+        self._async_dispatch = async_dispatch
+        self._notify_queue: Optional[queue.SimpleQueue[list[tuple[str, UserRole]]]] = None
+        if async_dispatch:
+            self._notify_queue = queue.SimpleQueue()
+            dispatcher = threading.Thread(
+                target=self._dispatch_loop,
+                name="ControlManagerNotify",
+                daemon=True,
+            )
+            dispatcher.start()
+
+    def _dispatch_loop(self) -> None:
+        """Drain queued notification batches on the dispatcher thread."""
+        assert self._notify_queue is not None
+        while True:
+            pending = self._notify_queue.get()
+            self._deliver_changes(pending)
+
+    def _publish(self) -> None:
+        """Publish a fresh read snapshot (call with the lock held)."""
+        self._snapshot = _Snapshot(
+            active=self._active_controller,
+            requester=self._takeover_requester,
+            roles={uid: s.role for uid, s in self._sessions.items()},
+        )
 
     @property
     def active_controller(self) -> Optional[str]:
-        """Get the current controller's user ID."""
-        with self._lock:
-            return self._active_controller
+        """Get the current controller's user ID (lock-free read)."""
+        return self._snapshot.active
 
     @property
     def observer_count(self) -> int:
-        """Get the number of observers."""
-        with self._lock:
-            return sum(
-                1
-                for s in self._sessions.values()
-                if s.role == UserRole.OBSERVER
-            )
+        """Get the number of observers (O(1), lock-free read)."""
+        return len(self._observers)
 
     def request_control(self, user_id: str) -> bool:
         """Request control of the robot.
@@ -107,34 +185,46 @@ class ControlManager:
         Returns:
             True if control was granted, False if user becomes observer
         """
+        pending: list[tuple[str, UserRole]] = []
+        # Capture the clock before entering the critical section
+        now = _time()
         with self._lock:
-            now = time.time()
-
             if user_id in self._sessions:
                 # Update existing session
                 self._sessions[user_id].last_activity = now
-                if self._sessions[user_id].role == UserRole.CONTROLLER:
+                if self._sessions[user_id].role == _CONTROLLER:
                     return True
             else:
                 # New session
                 self._sessions[user_id] = UserSession(
                     user_id=user_id,
-                    role=UserRole.DISCONNECTED,
+                    role=_DISCONNECTED,
                     connected_at=now,
                     last_activity=now,
                 )
 
+            prev_role = self._sessions[user_id].role
             if self._active_controller is None:
                 # No active controller - grant control
                 self._active_controller = user_id
-                self._sessions[user_id].role = UserRole.CONTROLLER
-                self._notify_change(user_id, UserRole.CONTROLLER)
-                return True
+                self._sessions[user_id].role = _CONTROLLER
+                self._observers.pop(user_id, None)
+                granted = True
+                if prev_role != _CONTROLLER:
+                    pending.append((user_id, _CONTROLLER))
             else:
                 # Controller exists - become observer
-                self._sessions[user_id].role = UserRole.OBSERVER
-                self._notify_change(user_id, UserRole.OBSERVER)
-                return False
+                self._sessions[user_id].role = _OBSERVER
+                self._observers[user_id] = None
+                granted = False
+                # Repeated requests from an existing observer are no-ops
+                # downstream; only notify on an actual role change
+                if prev_role != _OBSERVER:
+                    pending.append((user_id, _OBSERVER))
+            self._publish()
+
+        self._dispatch_changes(pending)
+        return granted
 
     def request_takeover(self, user_id: str) -> bool:
         """Request to take over control from current controller.
@@ -165,6 +255,7 @@ class ControlManager:
                 return False  # Takeover already pending
 
             self._takeover_requester = user_id
+            self._publish()
             # TODO: Implement takeover notification to current controller
             # TODO: Implement timeout for auto-takeover
             return True
@@ -191,16 +282,16 @@ class ControlManager:
                 return False
 
             self._takeover_requester = None
+            self._publish()
             return True
 
     def has_pending_takeover(self) -> bool:
         """Check if there's a pending takeover request.
 
         Returns:
-            True if a takeover request is pending
+            True if a takeover request is pending (lock-free read)
         """
-        with self._lock:
-            return self._takeover_requester is not None
+        return self._snapshot.requester is not None
 
     def approve_takeover(self, approver_id: str) -> bool:
         """Approve a pending takeover request.
@@ -212,6 +303,7 @@ class ControlManager:
             True if takeover approved and completed, False if approver is not
             controller, no pending request, or requester has disconnected
         """
+        pending: list[tuple[str, UserRole]] = []
         with self._lock:
             if approver_id != self._active_controller:
                 return False
@@ -225,19 +317,25 @@ class ControlManager:
             if new_controller not in self._sessions:
                 # Requester disconnected while waiting - clear the request
                 self._takeover_requester = None
+                self._publish()
                 return False
 
             old_controller = self._active_controller
 
             # Transfer control
             self._active_controller = new_controller
-            self._sessions[new_controller].role = UserRole.CONTROLLER
-            self._sessions[old_controller].role = UserRole.OBSERVER
+            self._sessions[new_controller].role = _CONTROLLER
+            self._sessions[old_controller].role = _OBSERVER
+            self._observers.pop(new_controller, None)
+            self._observers[old_controller] = None
             self._takeover_requester = None
+            self._publish()
 
-            self._notify_change(new_controller, UserRole.CONTROLLER)
-            self._notify_change(old_controller, UserRole.OBSERVER)
-            return True
+            pending.append((new_controller, _CONTROLLER))
+            pending.append((old_controller, _OBSERVER))
+
+        self._dispatch_changes(pending)
+        return True
 
     def disconnect(self, user_id: str) -> None:
         """Handle user disconnection.
@@ -249,6 +347,7 @@ class ControlManager:
         Args:
             user_id: Disconnecting user's ID
         """
+        pending: list[tuple[str, UserRole]] = []
         with self._lock:
             if user_id not in self._sessions:
                 return
@@ -258,21 +357,74 @@ class ControlManager:
                 self._takeover_requester = None
 
             was_controller = user_id == self._active_controller
-            self._sessions[user_id].role = UserRole.DISCONNECTED
+            self._sessions[user_id].role = _DISCONNECTED
             del self._sessions[user_id]
-
-            # Notify that user disconnected (for lifecycle tracking symmetry)
-            self._notify_change(user_id, UserRole.DISCONNECTED)
+            self._observers.pop(user_id, None)
 
             if was_controller:
                 self._active_controller = None
-                # Find first observer to promote
-                for session in self._sessions.values():
-                    if session.role == UserRole.OBSERVER:
-                        self._active_controller = session.user_id
-                        session.role = UserRole.CONTROLLER
-                        self._notify_change(session.user_id, UserRole.CONTROLLER)
-                        break
+                # Promote the longest-waiting observer (FIFO)
+                try:
+                    promoted, _ = self._observers.popitem(last=False)
+                except KeyError:
+                    pass
+                else:
+                    self._active_controller = promoted
+                    self._sessions[promoted].role = _CONTROLLER
+
+            self._publish()
+
+            # Notify that user disconnected (for lifecycle tracking symmetry)
+            pending.append((user_id, _DISCONNECTED))
+            if self._active_controller is not None and was_controller:
+                pending.append((self._active_controller, _CONTROLLER))
+
+        self._dispatch_changes(pending)
+
+    def disconnect_many(self, user_ids: Iterable[str]) -> None:
+        """Handle a batch of user disconnections in one lock acquisition.
+
+        Equivalent to calling disconnect() per user but takes the lock
+        once, promotes at most one observer after the whole batch is
+        removed, and dispatches all notifications in a single pass —
+        useful when a gateway drops a group of clients at once.
+
+        Args:
+            user_ids: IDs of the disconnecting users
+        """
+        pending: list[tuple[str, UserRole]] = []
+        with self._lock:
+            controller_left = False
+            for user_id in user_ids:
+                if user_id not in self._sessions:
+                    continue
+
+                if self._takeover_requester == user_id:
+                    self._takeover_requester = None
+
+                if user_id == self._active_controller:
+                    self._active_controller = None
+                    controller_left = True
+
+                self._sessions[user_id].role = _DISCONNECTED
+                del self._sessions[user_id]
+                self._observers.pop(user_id, None)
+                pending.append((user_id, _DISCONNECTED))
+
+            if controller_left:
+                # Promote the longest-waiting surviving observer (FIFO)
+                try:
+                    promoted, _ = self._observers.popitem(last=False)
+                except KeyError:
+                    pass
+                else:
+                    self._active_controller = promoted
+                    self._sessions[promoted].role = _CONTROLLER
+                    pending.append((promoted, _CONTROLLER))
+
+            self._publish()
+
+        self._dispatch_changes(pending)
 
     def update_activity(self, user_id: str) -> None:
         """Update last activity timestamp for a user.
@@ -280,9 +432,10 @@ class ControlManager:
         Args:
             user_id: User ID to update
         """
+        now = _time()
         with self._lock:
             if user_id in self._sessions:
-                self._sessions[user_id].last_activity = time.time()
+                self._sessions[user_id].last_activity = now
 
     def get_user_role(self, user_id: str) -> UserRole:
         """Get the role of a user.
@@ -291,12 +444,46 @@ class ControlManager:
             user_id: User ID to query
 
         Returns:
-            UserRole enum value
+            UserRole enum value (lock-free read)
         """
-        with self._lock:
-            if user_id in self._sessions:
-                return self._sessions[user_id].role
-            return UserRole.DISCONNECTED
+        return self._snapshot.roles.get(user_id, _DISCONNECTED)
+
+    def _dispatch_changes(self, pending: list[tuple[str, UserRole]]) -> None:
+        """Dispatch queued role changes after the lock has been released.
+
+        With async_dispatch, the batch is handed to the dispatcher thread
+        and the mutating thread returns immediately; otherwise delivery is
+        synchronous on the calling thread.
+        """
+        if not pending:
+            return
+
+        if self._notify_queue is not None:
+            self._notify_queue.put(pending)
+            return
+
+        self._deliver_changes(pending)
+
+    def _deliver_changes(self, pending: list[tuple[str, UserRole]]) -> None:
+        """Invoke the configured callback(s) for a batch of role changes.
+
+        Uses the batched callback when configured so one operation emits a
+        single invocation; otherwise falls back to per-change notification.
+        """
+        if self._on_control_changes is not None:
+            try:
+                self._on_control_changes(pending)
+            except Exception as e:
+                # Log but don't let callback errors affect control manager
+                _logger.error(
+                    "Error in batched control change callback: %s",
+                    e,
+                    exc_info=True,
+                )
+            return
+
+        for user_id, new_role in pending:
+            self._notify_change(user_id, new_role)
 
     def _notify_change(self, user_id: str, new_role: UserRole) -> None:
         """Notify callback of control change."""
@@ -308,7 +495,7 @@ class ControlManager:
                 _logger.error(
                     "Error in control change callback for user %s -> %s: %s",
                     user_id,
-                    new_role.value,
+                    new_role.label,
                     e,
                     exc_info=True,
                 )
@@ -23,16 +23,20 @@ See Also:
 import logging
 import threading
 import time
+from collections import deque
 from dataclasses import dataclass
-from typing import Callable, List, Optional
+from typing import Callable, Deque, List, Optional
 
 # Module logger for emergency stop events
 _logger = logging.getLogger(__name__)
 
+# Bound at import so the stop path skips the module attribute lookup
+_time = time.time
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class EmergencyStopEvent:
-    """Record of an emergency stop event."""
+    """Record of an emergency stop event (immutable, no per-instance dict)."""
 
     timestamp: float
     triggered_by: str
@@ -82,11 +86,16 @@ class EmergencyStop:
         self._stopped = threading.Event()
         self._motor_stop = motor_stop_callback
         self._on_state_change = on_state_change
-        self._history: List[EmergencyStopEvent] = []
-        self._history_lock = threading.Lock()
+        # Bounded ring: deque drops the oldest entry on overflow in O(1).
+        # Appends and snapshots are single C calls under the GIL, so no
+        # history lock is needed; trigger()/reset() hold only _state_lock.
+        self._history: Deque[EmergencyStopEvent] = deque(maxlen=self.MAX_HISTORY)
         # State lock for atomic test-and-set/clear transitions
         # Ensures motor_stop and on_state_change are called exactly once per transition
         self._state_lock = threading.Lock()
+        # Condition on the state lock so wait_for_reset() can sleep until
+        # reset() notifies instead of polling
+        self._reset_condition = threading.Condition(self._state_lock)
 
     @property
     def is_stopped(self) -> bool:
@@ -103,6 +112,20 @@ class EmergencyStop:
             triggered_by: User or system that triggered the stop
             reason: Human-readable reason for the stop
         """
+        # Fast path: already stopped. The flag only transitions back via
+        # reset(), so an observed True is stable for our purposes, and an
+        # idempotent re-trigger must not re-fire the callbacks — just
+        # record the event without touching the state lock.
+        if self._stopped.is_set():
+            self._history.append(
+                EmergencyStopEvent(
+                    timestamp=_time(),
+                    triggered_by=triggered_by,
+                    reason=reason,
+                )
+            )
+            return
+
         # Atomic test-and-set with motor stop under lock
         # This ensures only one thread calls motor_stop per transition
         performed_transition = False
@@ -129,23 +152,19 @@ class EmergencyStop:
                 # Log but don't fail - safety critical path must complete
                 _logger.exception("Motor stop callback failed")
 
-        # Log event (non-blocking if possible)
-        event = EmergencyStopEvent(
-            timestamp=time.time(),
-            triggered_by=triggered_by,
-            reason=reason,
+        # Log event lock-free: deque.append is a single C call that holds
+        # the GIL throughout, so it cannot tear or drop entries, and maxlen
+        # trims the oldest entry in the same operation. No lock means the
+        # stop path can never stall (or lose an audit record) behind a
+        # get_history() caller.
+        self._history.append(
+            EmergencyStopEvent(
+                timestamp=_time(),
+                triggered_by=triggered_by,
+                reason=reason,
+            )
         )
 
-        # Try to log without blocking
-        if self._history_lock.acquire(blocking=False):
-            try:
-                self._history.append(event)
-                # Trim history if needed
-                if len(self._history) > self.MAX_HISTORY:
-                    self._history = self._history[-self.MAX_HISTORY :]
-            finally:
-                self._history_lock.release()
-
         # Notify state change outside lock (only if we performed the transition)
         if state_callback and performed_transition:
             try:
@@ -176,21 +195,20 @@ class EmergencyStop:
                 self._stopped.clear()
                 performed_transition = True
                 state_callback = self._on_state_change
+                # Wake any threads blocked in wait_for_reset()
+                self._reset_condition.notify_all()
 
         if not performed_transition:
             return False
 
-        # Log the reset (outside state lock, but uses history lock)
-        event = EmergencyStopEvent(
-            timestamp=time.time(),
-            triggered_by=reset_by,
-            reason="Emergency stop reset",
+        # Log the reset (outside state lock; deque.append is GIL-atomic)
+        self._history.append(
+            EmergencyStopEvent(
+                timestamp=_time(),
+                triggered_by=reset_by,
+                reason="Emergency stop reset",
+            )
         )
-        with self._history_lock:
-            self._history.append(event)
-            # Trim history if needed
-            if len(self._history) > self.MAX_HISTORY:
-                self._history = self._history[-self.MAX_HISTORY :]
 
         # Notify state change outside lock (only if we performed the transition)
         if state_callback:
@@ -212,9 +230,9 @@ class EmergencyStop:
         """
         if limit <= 0:
             return []
-            
-        with self._history_lock:
-            return self._history[-limit:]
+
+        # list(deque) copies in one C call under the GIL; no lock needed
+        return list(self._history)[-limit:]
 
     def wait_for_reset(self, timeout: Optional[float] = None) -> bool:
         """Wait for emergency stop to be reset.
@@ -233,11 +251,6 @@ class EmergencyStop:
         if timeout == 0:
             return not self._stopped.is_set()
 
-        # We need to wait for the flag to be cleared
-        # threading.Event doesn't have wait_for_clear, so we poll
-        start = time.monotonic()
-        while self._stopped.is_set():
-            if timeout is not None and (time.monotonic() - start) > timeout:
-                return False
-            time.sleep(0.01)  # 10ms poll interval
-        return True
+        # Block on the condition until reset() notifies (no polling)
+        with self._reset_condition:
+            return self._reset_condition.wait_for(lambda: not self._stopped.is_set(), timeout=timeout)
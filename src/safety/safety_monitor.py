@@ -26,12 +26,22 @@ See Also:
     - config/config.json: safety section for thresholds
 """
 
+import json
 import logging
 import threading
 import time
-from dataclasses import dataclass
+
+import numpy
 from enum import Enum
-from typing import Callable, Optional
+from typing import Callable, NamedTuple, Optional
+
+try:
+    import orjson
+except ImportError:
+    # Optional accelerator - stdlib json is the fallback
+    orjson = None
+
+from src.core.scheduling import TIER1_PRIORITY, set_thread_priority
 
 # Module logger for safety monitoring events
 _logger = logging.getLogger(__name__)
@@ -45,9 +55,16 @@ class OperationMode(Enum):
     STOPPED = "stopped"
 
 
-@dataclass
-class SafetyStatus:
-    """Current safety system status.
+# Members bound at import and compared with `is` (enum members are
+# singletons): a module-global load beats the enum descriptor lookup on
+# every tick
+_MANUAL = OperationMode.MANUAL
+_AUTONOMOUS = OperationMode.AUTONOMOUS
+_STOPPED = OperationMode.STOPPED
+
+
+class SafetyStatus(NamedTuple):
+    """Current safety system status (immutable snapshot).
 
     Attributes:
         mode: Current operation mode
@@ -81,12 +98,12 @@ class SafetyMonitor(threading.Thread):
     This thread is non-daemon to ensure clean shutdown. The main program
     must call terminate() followed by join() during shutdown.
 
-    Lock Acquisition Order:
-        To prevent deadlocks, always acquire locks in this order:
-        1. _mode_lock (for operation mode)
-        2. _status_lock (for safety status)
-        3. _signal_lock (for signal timing)
-        Any code acquiring multiple locks must follow this order.
+    Locking:
+        None. _status is an immutable SafetyStatus published by a single
+        GIL-atomic reference store, and _mode/_last_signal_time are
+        single reference/float attributes with the same guarantee, so a
+        reader can only ever observe a complete old or new value, and
+        stale-by-one-tick is within the signal timeout's tolerance.
 
     Attributes:
         status: Current SafetyStatus
@@ -105,8 +122,13 @@ class SafetyMonitor(threading.Thread):
         >>> monitor.join()
     """
 
-    # Monitor frequency
-    POLL_INTERVAL = 0.1  # 10Hz
+    # Monitor frequencies (deadline-driven; see run())
+    POLL_INTERVAL = 0.1  # 10Hz ceiling (fault + signal checks)
+    BATTERY_POLL_INTERVAL = 0.5  # 2Hz - battery decays on a seconds timescale
+    BATTERY_POLL_RELAXED = 2.0  # cadence while comfortably above the threshold
+    BATTERY_MARGIN = 0.5  # volts above stop threshold considered "near"
+    ISSUE_REPEAT_INTERVAL = 1.0  # re-emit cadence for an unchanged issue set
+    VOLTAGE_WINDOW = 16  # samples in the debounce ring
 
     def __init__(
         self,
@@ -115,6 +137,7 @@ class SafetyMonitor(threading.Thread):
         on_safety_issue: Optional[Callable[[str, str], None]] = None,
         battery_stop_voltage: float = 10.5,
         battery_warning_voltage: float = 11.0,
+        get_health_snapshot: Optional[Callable[[], tuple[float, bool]]] = None,
     ):
         """Initialize the safety monitor.
 
@@ -124,6 +147,10 @@ class SafetyMonitor(threading.Thread):
             on_safety_issue: Callback when safety issue detected (trigger, reason)
             battery_stop_voltage: Voltage threshold for automatic stop
             battery_warning_voltage: Voltage threshold for warning
+            get_health_snapshot: Callback returning (voltage, fault) in one
+                call. Preferred over the two separate callbacks when set,
+                halving the I2C round trips per poll - wire it to read
+                both ThunderBorg registers while holding the bus once.
         """
         # Non-daemon thread to ensure clean shutdown
         # Main program must call terminate() + join() on shutdown
@@ -131,19 +158,56 @@ class SafetyMonitor(threading.Thread):
 
         self._get_battery_voltage = get_battery_voltage
         self._get_fault_status = get_fault_status
+        self._get_health_snapshot = get_health_snapshot
         self._on_safety_issue = on_safety_issue
         self._battery_stop_voltage = battery_stop_voltage
         self._battery_warning_voltage = battery_warning_voltage
+        # Integer-millivolt thresholds, precomputed once so the per-tick
+        # comparisons against the quantized ring are single integer ops
+        self._battery_stop_mv = int(battery_stop_voltage * 1000)
+        self._battery_warning_mv = int(battery_warning_voltage * 1000)
 
+        # GIL-atomic attribute (see class Locking docs)
         self._mode = OperationMode.STOPPED
-        # Lock acquisition order: _mode_lock -> _status_lock -> _signal_lock
-        # Always acquire locks in this order to prevent deadlocks
-        self._mode_lock = threading.Lock()
         self._terminated = threading.Event()
-        self._signal_lock = threading.Lock()  # Protects _last_signal_time
-        self._last_signal_time = time.time()
+        # Secondary wake-up: set by signal_received()/terminate() so the
+        # monitor can shorten its deadline wait instead of sleeping it out
+        self._wake = threading.Event()
+        # Monotonic clock for all deadline math - immune to NTP steps.
+        # The offset converts internal timestamps back to wall clock for
+        # externally visible fields (SafetyStatus.last_check).
+        self._last_signal_time = time.monotonic()
+        self._wall_offset = time.time() - time.monotonic()
         self._signal_timeout = 1.0  # 1 second timeout
 
+        # Last hardware readings, reused between their poll deadlines
+        self._battery_voltage = 0.0
+        self._fault_detected = False
+        self._fault_message = ""
+
+        # Ring of recent voltage samples; threshold decisions use the
+        # window median so a transient dip cannot trip a stop. Samples
+        # are quantized to int16 millivolts - the ThunderBorg ADC
+        # resolves no finer than ~10mV, so nothing is lost, and the ring
+        # is a quarter the size of a float64 one.
+        self._voltage_ring = numpy.zeros(self.VOLTAGE_WINDOW, dtype=numpy.int16)
+        self._voltage_samples = 0
+
+        # Rate limiting for repeated identical issues (see _check_safety)
+        self._last_issue_signature: Optional[tuple[str, ...]] = None
+        self._last_issue_emit = 0.0
+
+        # JSON cache for status_json(), keyed by snapshot identity
+        self._status_json = b""
+        self._status_json_source: Optional[SafetyStatus] = None
+
+        # Key of the last published snapshot; identical ticks skip the
+        # republish so downstream consumers (and the JSON cache) see a
+        # stable object while nothing changes. Liveness is tracked in
+        # _last_check_monotonic instead of churning last_check.
+        self._last_status_key: Optional[tuple] = None
+        self._last_check_monotonic = 0.0
+
         self._status = SafetyStatus(
             mode=OperationMode.STOPPED,
             battery_voltage=0.0,
@@ -153,74 +217,166 @@ class SafetyMonitor(threading.Thread):
             signal_ok=True,
             last_check=0.0,
         )
-        self._status_lock = threading.Lock()
 
     @property
     def status(self) -> SafetyStatus:
-        """Get current safety status (thread-safe copy)."""
-        with self._status_lock:
-            return SafetyStatus(
-                mode=self._status.mode,
-                battery_voltage=self._status.battery_voltage,
-                battery_ok=self._status.battery_ok,
-                fault_detected=self._status.fault_detected,
-                fault_message=self._status.fault_message,
-                signal_ok=self._status.signal_ok,
-                last_check=self._status.last_check,
-            )
+        """Get the current safety status (lock-free immutable snapshot)."""
+        return self._status
+
+    def status_json(self) -> bytes:
+        """Get the current status serialized as JSON bytes.
+
+        The encoding is cached per published snapshot, so several web
+        clients polling between monitor ticks share one serialization
+        instead of re-encoding each request.
+        """
+        status = self._status
+        if status is self._status_json_source:
+            return self._status_json
+
+        payload = status._asdict()
+        payload["mode"] = status.mode.value
+        if orjson is not None:
+            encoded = orjson.dumps(payload)
+        else:
+            encoded = json.dumps(payload).encode("utf-8")
+        self._status_json = encoded
+        self._status_json_source = status
+        return encoded
 
     @property
     def mode(self) -> OperationMode:
-        """Get current operation mode."""
-        with self._mode_lock:
-            return self._mode
+        """Get current operation mode (lock-free read)."""
+        return self._mode
 
     def set_mode(self, mode: OperationMode) -> None:
         """Set operation mode.
 
-        Note: Acquires _mode_lock then _status_lock (following lock order).
-
         Args:
             mode: New operation mode
         """
-        # Lock order: _mode_lock -> _status_lock (as documented in class)
-        with self._mode_lock:
-            self._mode = mode
-        with self._status_lock:
-            self._status.mode = mode
+        # Enum members are singletons; the reference store is GIL-atomic
+        self._mode = mode
+        self._status = self._status._replace(mode=mode)
+        # Re-evaluate now instead of waiting out the current deadline
+        self._wake.set()
 
     def signal_received(self) -> None:
         """Call this when a valid control signal is received.
 
         Updates the last signal time to prevent signal loss detection.
-        Thread-safe via _signal_lock.
+        The float store is GIL-atomic, so no lock is needed on this
+        per-message hot path.
         """
-        with self._signal_lock:
-            self._last_signal_time = time.time()
+        self._last_signal_time = time.monotonic()
+        # A fresh signal may shorten the pending deadline wait
+        self._wake.set()
 
     def terminate(self) -> None:
         """Signal the monitor thread to terminate."""
         self._terminated.set()
+        self._wake.set()
 
     def run(self) -> None:
-        """Main monitoring loop - runs at 10Hz."""
-        _logger.info("Safety monitor started (10Hz)")
+        """Main monitoring loop - deadline-driven, 10Hz ceiling.
+
+        Instead of waking unconditionally every 100ms, the loop computes
+        the next due deadline (battery poll, fault poll, or signal-loss
+        expiry) and sleeps until then. signal_received() and terminate()
+        set the wake event to cut a pending sleep short.
+        """
+        # Safety monitoring runs at Tier 1 priority (ADR-008)
+        set_thread_priority(TIER1_PRIORITY)
+        _logger.info("Safety monitor started (deadline-driven, 10Hz max)")
+
+        # Pre-bind everything touched per iteration so the loop runs on
+        # LOAD_FAST instead of repeated attribute traversals
+        check = self._check_safety
+        terminated = self._terminated.is_set
+        wake_clear = self._wake.clear
+        wake_wait = self._wake.wait
+        battery_interval = self._battery_poll_interval
+        monotonic = time.monotonic
+        poll_interval = self.POLL_INTERVAL
+        signal_timeout = self._signal_timeout
+
+        next_battery = 0.0  # poll both immediately on startup
+        next_fault = 0.0
+
+        while not terminated():
+            now = monotonic()
+            read_battery = now >= next_battery
+            read_fault = now >= next_fault
+            if read_battery:
+                next_battery = now + battery_interval()
+            if read_fault:
+                next_fault = now + poll_interval
 
-        while not self._terminated.is_set():
             try:
-                self._check_safety()
+                check(read_battery, read_fault)
             except Exception as e:
                 # Log but don't crash the safety monitor
                 _logger.error("Safety monitor error: %s", e, exc_info=True)
 
-            # Wait for next poll interval
-            self._terminated.wait(self.POLL_INTERVAL)
+            # Sleep until the earliest deadline. The signal-loss expiry
+            # only drives a wakeup while the signal is still fresh; once
+            # lost, the fault cadence paces re-checks.
+            now = monotonic()
+            signal_deadline = self._last_signal_time + signal_timeout
+            deadline = min(next_battery, next_fault)
+            if signal_deadline > now:
+                deadline = min(deadline, signal_deadline)
+
+            wake_clear()
+            timeout = deadline - now
+            if timeout > 0 and not terminated():
+                wake_wait(timeout)
 
         _logger.info("Safety monitor terminated")
 
-    def _check_safety(self) -> None:
+    def _record_voltage(self, voltage: float) -> None:
+        """Push a fresh voltage sample into the debounce ring.
+
+        The float reading is quantized to int16 millivolts once here, at
+        the callback boundary; everything downstream compares integers.
+        Zero/failed readings are not recorded - they mean "unknown",
+        not "empty battery".
+        """
+        mv = int(voltage * 1000)
+        if mv > 0:
+            self._voltage_ring[self._voltage_samples % self.VOLTAGE_WINDOW] = mv
+            self._voltage_samples += 1
+
+    def _debounced_mv(self) -> int:
+        """Median of the recent voltage window in millivolts (0 if empty)."""
+        filled = min(self._voltage_samples, self.VOLTAGE_WINDOW)
+        if filled == 0:
+            return 0
+        return int(numpy.median(self._voltage_ring[:filled]))
+
+    def _battery_poll_interval(self) -> float:
+        """Pick the battery poll cadence from the last reading.
+
+        Voltage decays over seconds-to-minutes, so far above the stop
+        threshold a relaxed cadence loses nothing; within BATTERY_MARGIN
+        of it (or with no reading yet) keep the fast cadence so a low
+        battery is still caught promptly.
+        """
+        voltage = self._battery_voltage
+        if voltage <= 0.0:
+            # No (or failed) reading - stay at the fast cadence
+            return self.BATTERY_POLL_INTERVAL
+        if voltage < self._battery_stop_voltage + self.BATTERY_MARGIN:
+            return self.BATTERY_POLL_INTERVAL
+        return self.BATTERY_POLL_RELAXED
+
+    def _check_safety(self, read_battery: bool = True, read_fault: bool = True) -> None:
         """Perform safety checks based on current mode.
 
+        Hardware reads run on their own cadences (see run()); between
+        polls the last readings are reused so signal-loss detection stays
+        at full rate without extra I2C traffic.
+
         Graceful Degradation (No-Sensor Modes):
             When sensor callbacks are not configured or fail, the monitor
             operates in degraded mode with safe defaults:
@@ -235,77 +391,140 @@ class SafetyMonitor(threading.Thread):
             sensors, relying on the ThunderBorg's built-in 250ms failsafe as
             the ultimate safety layer.
         """
-        now = time.time()
-        issues = []
-
-        with self._mode_lock:
-            current_mode = self._mode
+        now = time.monotonic()
+        # Allocated lazily: the healthy tick is the common case
+        issues = None
 
-        # Check signal timing (thread-safe read)
-        with self._signal_lock:
-            last_signal = self._last_signal_time
+        # GIL-atomic reads; no lock needed (see class Locking docs)
+        current_mode = self._mode
+        last_signal = self._last_signal_time
         signal_ok = (now - last_signal) < self._signal_timeout
 
-        # Read battery voltage if available
-        battery_voltage = 0.0
+        if current_mode is _STOPPED:
+            # Idle fast path: nothing downstream acts on the readings, so
+            # skip the hardware traffic; only republish when signal_ok
+            # actually flips, keeping the snapshot (and its JSON cache)
+            # stable across idle ticks
+            self._last_check_monotonic = now
+            if self._status.signal_ok != signal_ok:
+                self._status = self._status._replace(
+                    signal_ok=signal_ok,
+                    last_check=now + self._wall_offset,
+                )
+                self._last_status_key = None
+            return
+
+        if current_mode is _MANUAL:
+            # Fault checks only trigger action autonomously; battery is
+            # still read for the advisory warning
+            read_fault = False
+
+        # Read battery voltage if due, else reuse the last reading
         battery_ok = True
-        if self._get_battery_voltage:
+        if self._get_health_snapshot and (read_battery or read_fault):
+            # Batched path: both registers in one bus transaction
             try:
-                battery_voltage = self._get_battery_voltage()
+                voltage, fault = self._get_health_snapshot()
+                self._battery_voltage = voltage
+                self._record_voltage(voltage)
+                self._fault_detected = fault
+                self._fault_message = "Motor driver fault detected" if fault else ""
             except Exception as e:
-                _logger.error(
-                    "Failed to read battery voltage: %s", e, exc_info=True
-                )
-                battery_voltage = 0.0
+                _logger.error("Failed to read health snapshot: %s", e, exc_info=True)
+                self._battery_voltage = 0.0
+                self._fault_detected = False
+                self._fault_message = ""
+            read_battery = read_fault = False  # already refreshed
 
-        # Read fault status if available
-        fault_detected = False
-        fault_message = ""
-        if self._get_fault_status:
+        if read_battery and self._get_battery_voltage:
             try:
-                fault_detected = self._get_fault_status()
-                if fault_detected:
-                    fault_message = "Motor driver fault detected"
+                self._battery_voltage = self._get_battery_voltage()
+                self._record_voltage(self._battery_voltage)
             except Exception as e:
-                _logger.error(
-                    "Failed to read fault status: %s", e, exc_info=True
-                )
-                fault_detected = False
-                fault_message = ""
+                _logger.error("Failed to read battery voltage: %s", e, exc_info=True)
+                self._battery_voltage = 0.0
+        battery_voltage = self._battery_voltage
+        # Threshold decisions use the debounced window, not a single
+        # sample, so a transient dip under load cannot trip a stop.
+        # Integer millivolts throughout; volts only at publish time.
+        debounced_mv = self._debounced_mv()
+
+        # Read fault status if due, else reuse the last reading
+        if read_fault and self._get_fault_status:
+            try:
+                self._fault_detected = self._get_fault_status()
+                self._fault_message = "Motor driver fault detected" if self._fault_detected else ""
+            except Exception as e:
+                _logger.error("Failed to read fault status: %s", e, exc_info=True)
+                self._fault_detected = False
+                self._fault_message = ""
+        fault_detected = self._fault_detected
+        fault_message = self._fault_message
 
         # Mode-dependent checks
-        if current_mode == OperationMode.AUTONOMOUS:
+        if current_mode is _AUTONOMOUS:
             # Autonomous: strict battery check
-            if 0 < battery_voltage < self._battery_stop_voltage:
+            if 0 < debounced_mv < self._battery_stop_mv:
                 battery_ok = False
-                issues.append(f"Battery critical: {battery_voltage:.1f}V")
+                issues = [f"Battery critical: {debounced_mv / 1000:.1f}V"]
 
             if fault_detected:
-                issues.append(fault_message)
+                if issues is None:
+                    issues = [fault_message]
+                else:
+                    issues.append(fault_message)
 
             if not signal_ok:
-                issues.append("Signal lost")
+                if issues is None:
+                    issues = ["Signal lost"]
+                else:
+                    issues.append("Signal lost")
 
-        elif current_mode == OperationMode.MANUAL:
+        elif current_mode is _MANUAL:
             # Manual: only signal loss triggers stop
             # Battery warning is advisory only
-            if 0 < battery_voltage < self._battery_warning_voltage:
+            if 0 < debounced_mv < self._battery_warning_mv:
                 # Warning only, don't stop
                 pass
 
             if not signal_ok:
-                issues.append("Signal lost")
-
-        # Update status
-        with self._status_lock:
-            self._status.battery_voltage = battery_voltage
-            self._status.battery_ok = battery_ok
-            self._status.fault_detected = fault_detected
-            self._status.fault_message = fault_message
-            self._status.signal_ok = signal_ok
-            self._status.last_check = now
-
-        # Trigger safety callback if issues found
-        if issues and self._on_safety_issue and current_mode != OperationMode.STOPPED:
-            reason = "; ".join(issues)
-            self._on_safety_issue("SafetyMonitor", reason)
+                issues = ["Signal lost"]
+
+        # Publish the finished snapshot with one atomic reference store -
+        # but only when something observable changed. An unchanged key
+        # leaves the previous snapshot in place, so the JSON cache stays
+        # hot and downstream pollers see no spurious "new" status.
+        self._last_check_monotonic = now
+        new_key = (
+            current_mode,
+            battery_ok,
+            fault_detected,
+            fault_message,
+            signal_ok,
+            round(battery_voltage, 1),
+        )
+        if new_key != self._last_status_key:
+            self._last_status_key = new_key
+            self._status = SafetyStatus(
+                mode=current_mode,
+                battery_voltage=battery_voltage,
+                battery_ok=battery_ok,
+                fault_detected=fault_detected,
+                fault_message=fault_message,
+                signal_ok=signal_ok,
+                last_check=now + self._wall_offset,
+            )
+
+        # Trigger safety callback if issues found. A persistent fault
+        # would otherwise re-fire on every tick; identical issue sets are
+        # re-emitted at most once per ISSUE_REPEAT_INTERVAL.
+        if issues and self._on_safety_issue and current_mode is not _STOPPED:
+            signature = tuple(issues)
+            if signature != self._last_issue_signature or now - self._last_issue_emit >= self.ISSUE_REPEAT_INTERVAL:
+                self._last_issue_signature = signature
+                self._last_issue_emit = now
+                # Single issue is the common failure shape; skip the join
+                reason = issues[0] if len(issues) == 1 else "; ".join(issues)
+                self._on_safety_issue("SafetyMonitor", reason)
+        elif not issues:
+            self._last_issue_signature = None
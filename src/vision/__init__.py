@@ -7,4 +7,7 @@ This module provides:
 """
 
 # TODO: Migrate ImageProcessor.py to this module
-# Placeholder - will be populated in Phase 1
+
+from .hunt_numba import row_centroids, threshold_colour, warm_up
+
+__all__ = ["row_centroids", "threshold_colour", "warm_up"]
@@ -0,0 +1,123 @@
+# coding: utf-8
+"""Numba-accelerated colour hunting kernels (ADR-005).
+
+The line-hunting pipeline thresholds each frame against the configured
+colour range and then locates the line on the two target rows. Done in
+pure Python these per-pixel loops crawl on the Pi, so the kernels here
+are compiled with Numba when it is available: ``parallel=True`` spreads
+the row loop across cores via ``prange``, ``nogil=True`` lets the camera
+and control threads keep running, and ``cache=True`` avoids recompiling
+on every start.
+
+When Numba is not installed the public functions fall back to NumPy
+vectorized equivalents, so behaviour is identical either way. Call
+``warm_up()`` once at startup so the JIT cost is not paid on the first
+real frame.
+
+See Also:
+    - docs/DECISIONS.md: ADR-005 for colour-based tracking decision
+"""
+
+import logging
+from typing import Tuple
+
+import numpy as np
+
+# Module logger
+_logger = logging.getLogger(__name__)
+
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+    prange = range
+
+
+def _threshold_core(frame: np.ndarray, lo: np.ndarray, hi: np.ndarray) -> np.ndarray:
+    """Per-pixel colour range test, written as plain loops for Numba."""
+    height = frame.shape[0]
+    width = frame.shape[1]
+    channels = frame.shape[2]
+    mask = np.zeros((height, width), np.uint8)
+    for y in prange(height):
+        for x in range(width):
+            inside = True
+            for c in range(channels):
+                value = frame[y, x, c]
+                if value < lo[c] or value > hi[c]:
+                    inside = False
+                    break
+            if inside:
+                mask[y, x] = 255
+    return mask
+
+
+def _row_centroid_core(row: np.ndarray) -> float:
+    """Centroid of the set pixels in one mask row, -1.0 if the row is empty."""
+    total = 0
+    count = 0
+    for x in range(row.shape[0]):
+        if row[x] != 0:
+            total += x
+            count += 1
+    if count == 0:
+        return -1.0
+    return total / count
+
+
+if njit is not None:
+    _threshold_core = njit(parallel=True, nogil=True, cache=True)(_threshold_core)
+    _row_centroid_core = njit(nogil=True, cache=True)(_row_centroid_core)
+
+
+def threshold_colour(frame: np.ndarray, lo, hi) -> np.ndarray:
+    """Build a mask of the pixels inside the hunt colour range.
+
+    Args:
+        frame: HxWxC uint8 image in the same channel order as lo/hi
+        lo: Per-channel minimum values (e.g. Settings.minHuntColour)
+        hi: Per-channel maximum values (e.g. Settings.maxHuntColour)
+
+    Returns:
+        HxW uint8 mask, 255 where all channels are within range
+    """
+    lo = np.asarray(lo, np.uint8)
+    hi = np.asarray(hi, np.uint8)
+    if njit is not None:
+        return _threshold_core(np.ascontiguousarray(frame), lo, hi)
+    # NumPy fallback: vectorized range test over all channels
+    inside = np.logical_and(frame >= lo, frame <= hi).all(axis=2)
+    return inside.astype(np.uint8) * 255
+
+
+def row_centroids(mask: np.ndarray, y1: int, y2: int) -> Tuple[float, float]:
+    """Locate the line centre on the two target rows of a mask.
+
+    Args:
+        mask: HxW uint8 mask from threshold_colour
+        y1: Row index for the closest target point (Settings.targetY1)
+        y2: Row index for the furthest target point (Settings.targetY2)
+
+    Returns:
+        (cx1, cx2) centroid X positions, -1.0 where the row has no line
+    """
+    if njit is not None:
+        return (
+            _row_centroid_core(np.ascontiguousarray(mask[y1, :])),
+            _row_centroid_core(np.ascontiguousarray(mask[y2, :])),
+        )
+    # NumPy fallback
+    results = []
+    for y in (y1, y2):
+        columns = np.flatnonzero(mask[y, :])
+        results.append(float(columns.mean()) if columns.size else -1.0)
+    return results[0], results[1]
+
+
+def warm_up(width: int = 8, height: int = 8) -> None:
+    """Trigger JIT compilation with a dummy frame so the first real frame is fast."""
+    frame = np.zeros((height, width, 3), np.uint8)
+    mask = threshold_colour(frame, (0, 0, 0), (255, 255, 255))
+    row_centroids(mask, 0, height - 1)
+    if njit is not None:
+        _logger.debug("Numba hunt kernels compiled")
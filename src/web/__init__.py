@@ -11,6 +11,6 @@ See Also:
     - docs/DECISIONS.md: ADR-004 for multi-user control model
 """
 
-# TODO: Implement Flask-SocketIO server in Phase 1
-# Current: monsterWeb.py uses raw socketserver (to be replaced)
-# Placeholder - will be populated in Phase 1
+from .monster_web_server import MonsterWebServer, joystick_to_motors
+
+__all__ = ["MonsterWebServer", "joystick_to_motors"]
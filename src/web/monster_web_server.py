@@ -0,0 +1,848 @@
+# coding: utf-8
+"""Flask-SocketIO web server for MonsterBorg (ADR-001).
+
+This module replaces the raw socketserver interface in monsterWeb.py with
+the WebSocket-based server decided in ADR-001:
+
+- HTTP routes for the control page, camera stream page, snapshots and health
+- SocketIO events for drive/joystick commands, speed, photos and takeover
+- Single-user control via ControlManager (ADR-004)
+- Emergency stop accessible to ANY connected user (ADR-009)
+- Per-client watchdog that stops the motors when commands stop arriving
+
+Telemetry and command acknowledgements are batched: instead of one WebSocket
+message per event, each client has a pending list that a background task
+flushes every 50 ms as a single ``batch`` message. This cuts socket writes
+(and their framing overhead) from N-per-event to 1-per-flush. Motor commands
+and emergency stop notifications stay unbatched because they are
+latency-critical.
+
+Hardware access is injected through callbacks so the server can be
+constructed and tested without a ThunderBorg or camera attached.
+
+See Also:
+    - docs/DECISIONS.md: ADR-001 for WebSocket library decision
+    - docs/DECISIONS.md: ADR-004 for multi-user control model
+    - docs/DECISIONS.md: ADR-009 for safety system architecture
+"""
+
+# eventlet is optional: when installed, every connection is served from one
+# cooperative greenlet loop instead of an OS thread each (8MB stack per
+# connection under threading mode). monkey_patch() must run before the other
+# imports so the stdlib primitives they capture are the green versions.
+try:
+    import eventlet
+
+    eventlet.monkey_patch()
+except ImportError:
+    eventlet = None
+
+import datetime
+import heapq
+import logging
+import os
+import struct
+import threading
+import time
+from collections import defaultdict, deque
+from pathlib import Path
+from typing import Callable, Deque, Dict, List, Optional, Tuple
+
+from flask import Flask, Response, render_template, request
+from flask.json.provider import JSONProvider
+from flask_socketio import SocketIO
+
+# orjson is optional: when present SocketIO payloads are serialized by its
+# C encoder instead of stdlib json, which matters at telemetry rates
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from src.core.scheduling import (
+    TIER1_PRIORITY,
+    TIER3_PRIORITY,
+    set_thread_affinity,
+    set_thread_priority,
+)
+from src.safety.control_manager import ControlManager, UserRole
+from src.safety.emergency_stop import EmergencyStop
+
+# Module logger
+_logger = logging.getLogger(__name__)
+
+# Bound at import for the per-command hot paths: monotonic_ns returns an
+# int (no float conversion, immune to wall-clock steps) and the module
+# binding skips the attribute lookup per call
+_monotonic_ns = time.monotonic_ns
+
+# Binary layout of the multiplexed "input" event: one opcode byte plus
+# two little-endian float32 arguments (9 bytes vs ~40 for the JSON
+# events it multiplexes). Decoding is one C call, and a single handler
+# replaces four passes through SocketIO's event-name dispatch.
+_INPUT_STRUCT = struct.Struct("<Bff")
+_OP_DRIVE = 0  # a=left, b=right
+_OP_JOYSTICK = 1  # a=x, b=y
+_OP_STOP = 2  # a, b unused
+_OP_SPEED = 3  # a=multiplier, b unused
+
+
+class _OrjsonProvider(JSONProvider):
+    """Flask JSON provider backed by orjson's C encoder.
+
+    Covers everything Flask serializes itself (request.get_json, error
+    responses, any remaining jsonify call sites) so the whole app shares
+    one fast encoder rather than stdlib json.
+    """
+
+    def dumps(self, obj, **kwargs) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY).decode("utf-8")
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+
+class _OrjsonShim:
+    """Adapter exposing the dumps/loads interface SocketIO expects.
+
+    python-socketio passes str-producing kwargs (separators etc.) that
+    orjson does not take, so they are accepted and ignored here, and the
+    bytes result is decoded to the str the packet encoder wants.
+    """
+
+    @staticmethod
+    def dumps(obj, *args, **kwargs) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY).decode("utf-8")
+
+    @staticmethod
+    def loads(data, *args, **kwargs):
+        return orjson.loads(data)
+
+
+def joystick_to_motors(x: float, y: float) -> Tuple[float, float]:
+    """Convert joystick x/y axes to left/right motor powers.
+
+    Forward on the stick drives both sides forward; sideways deflection
+    turns by driving the sides in opposite directions. The result is
+    normalized so neither side exceeds full power.
+
+    Args:
+        x: Horizontal axis, -1.0 (left) to 1.0 (right)
+        y: Vertical axis, -1.0 (back) to 1.0 (forward)
+
+    Returns:
+        (left, right) motor powers in the range -1.0 to 1.0
+    """
+    left = y + x
+    right = y - x
+    max_val = max(abs(left), abs(right))
+    if max_val > 1.0:
+        left /= max_val
+        right /= max_val
+    return left, right
+
+
+class MonsterWebServer:
+    """Flask-SocketIO web server with single-user control and safety hooks.
+
+    The server owns a ControlManager (who may drive) and an EmergencyStop
+    (anyone may stop). Motor and camera access go through callbacks supplied
+    by the caller, so hardware is optional.
+
+    Example:
+        >>> server = MonsterWebServer(motor_callback=set_motors,
+        ...                           frame_callback=get_frame)
+        >>> server.run()  # blocks; serves on 127.0.0.1:5000
+    """
+
+    # Seconds between telemetry broadcasts
+    TELEMETRY_INTERVAL = 0.1
+    # Keepalive cadence while the telemetry is unchanged: late joiners
+    # still get a snapshot within a second, but an idle robot no longer
+    # broadcasts identical payloads at 10 Hz
+    TELEMETRY_IDLE_INTERVAL = 1.0
+    # Seconds between watchdog checks
+    WATCHDOG_INTERVAL = 0.1
+    # Seconds without a command before the watchdog stops the motors
+    COMMAND_TIMEOUT = 1.0
+    # Cap on tracked watchdog clients: a reconnect flood of fresh sids
+    # must not grow the bookkeeping unbounded
+    WATCHDOG_MAX_CLIENTS = 1024
+    # Seconds between batched message flushes
+    BATCH_FLUSH_INTERVAL = 0.05
+    # Force a flush when a client's pending list reaches this size
+    BATCH_MAX_PENDING = 140
+    # Seconds between pending-motor-command applications (50 Hz cap)
+    MOTOR_APPLY_INTERVAL = 0.02
+    # Seconds between MJPEG stream frames (15 fps)
+    MJPEG_FRAME_INTERVAL = 1.0 / 15.0
+    # Skip motor writes when the command moved less than this
+    MOTOR_DELTA = 0.01
+    # But always rewrite within this period so the ThunderBorg's 250 ms
+    # hardware failsafe (ADR-009 Layer 1) keeps being fed
+    MOTOR_REFRESH = 0.2
+    # CPU pinning on the 4-core Pi (best effort, see set_thread_affinity):
+    # safety loops get their own core so socket bursts cannot delay a
+    # stop; web serving stays off it
+    SAFETY_CORES = frozenset({0})
+    WEB_CORES = frozenset({2, 3})
+
+    def __init__(
+        self,
+        motor_callback: Optional[Callable[[float, float], None]] = None,
+        frame_callback: Optional[Callable[[], Optional[bytes]]] = None,
+        battery_callback: Optional[Callable[[], float]] = None,
+        photo_directory: str = "~/monster-photos",
+        max_power: float = 1.0,
+        host: str = "127.0.0.1",
+        port: int = 5000,
+        async_mode: Optional[str] = None,
+    ):
+        """Initialize the web server.
+
+        Args:
+            motor_callback: Called with (left, right) in -1.0..1.0 scaled by
+                max_power to drive the motors. None for testing.
+            frame_callback: Returns the latest JPEG frame as a bytes-like
+                object (bytes, bytearray or memoryview - the server never
+                copies it), or None if no frame is available yet.
+            battery_callback: Returns the current battery voltage.
+            photo_directory: Directory photos are saved to (~ is expanded).
+            max_power: Power limit applied to all motor commands.
+            host: Address to bind to; default localhost only.
+            port: TCP port to serve on.
+            async_mode: Flask-SocketIO async mode. Defaults to "eventlet"
+                when the package is installed (all connections on one
+                cooperative loop), falling back to "threading" (one OS
+                thread per connection) when it is not.
+        """
+        if async_mode is None:
+            async_mode = "eventlet" if eventlet is not None else "threading"
+        template_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "templates")
+        self.app = Flask(__name__, template_folder=template_dir)
+        socketio_kwargs = {}
+        if orjson is not None:
+            self.app.json = _OrjsonProvider(self.app)
+            socketio_kwargs["json"] = _OrjsonShim
+        self.socketio = SocketIO(self.app, async_mode=async_mode, cors_allowed_origins=[], **socketio_kwargs)
+
+        self._motor_callback = motor_callback
+        self._frame_callback = frame_callback
+        self._battery_callback = battery_callback
+        # Resolved once; the per-photo traversal check is then a single
+        # parent comparison instead of three abspath/commonpath passes
+        self._photo_base = Path(os.path.expanduser(photo_directory)).resolve()
+        self._max_power = max_power
+        self._host = host
+        self._port = port
+
+        # Motor state, guarded by _motor_lock
+        self._motor_lock = threading.Lock()
+        self._current_left = 0.0
+        self._current_right = 0.0
+        self._speed_multiplier = 1.0
+        self._last_motor_write = 0
+        # Hot-path intervals precomputed as int nanoseconds: deadline
+        # math is then pure integer compares on _monotonic_ns values
+        self._command_timeout_ns = int(self.COMMAND_TIMEOUT * 1e9)
+        self._motor_refresh_ns = int(self.MOTOR_REFRESH * 1e9)
+
+        # Latest-wins slot between the drive/joystick handlers and the
+        # motor applier task: a touch joystick emits far faster than the
+        # I2C bus wants writes, and only the newest pair matters, so
+        # handlers overwrite the slot and the applier drains it at
+        # MOTOR_APPLY_INTERVAL. Stops bypass the slot (latency-critical).
+        # A deque(maxlen=1) is the slot: append/popleft/clear are single
+        # C calls under the GIL (and per-object locked on free-threaded
+        # builds), so producers and the consumer need no lock.
+        self._pending_motor: Deque[Tuple[float, float]] = deque(maxlen=1)
+
+        # Watchdog bookkeeping: a min-heap of (deadline, sid) entries so
+        # each tick pops only expired clients instead of scanning all of
+        # them. Commands push a new entry rather than rewriting the old
+        # one; _watchdog_deadline records which entry is current so stale
+        # heap entries are discarded on pop. Deadlines are monotonic -
+        # a wall-clock step must not fire the watchdog.
+        self._watchdog_lock = threading.Lock()
+        self._watchdog_heap: List[Tuple[int, str]] = []
+        self._watchdog_deadline: Dict[str, int] = {}
+
+        # Battery voltage cache: the reading is an I2C transaction and the
+        # value moves slowly, so refresh it at most once per second
+        self._battery_cache: Optional[float] = None
+        self._battery_read_time = 0.0
+
+        # Batched telemetry/ack messages per client, flushed every 50 ms
+        self._pending: Dict[str, List] = defaultdict(list)
+        self._pending_lock = threading.Lock()
+
+        self._running = False
+
+        # Controller flags maintained by _on_control_change: the
+        # per-command permission check is one dict .get instead of a
+        # role lookup plus enum compare at joystick emit rates
+        self._is_controller: Dict[str, bool] = {}
+
+        self._control_manager = ControlManager(on_control_change=self._on_control_change)
+        self._emergency_stop = EmergencyStop(
+            motor_stop_callback=self._motors_off,
+            on_state_change=self._on_emergency_change,
+        )
+
+        self._register_routes()
+        self._register_handlers()
+
+    # ------------------------------------------------------------------
+    # HTTP routes
+    # ------------------------------------------------------------------
+
+    def _register_routes(self) -> None:
+        """Register the HTTP routes on the Flask app."""
+
+        # The control pages are static: render them once at startup and
+        # serve the cached string instead of re-running Jinja per GET
+        with self.app.app_context():
+            index_html = render_template("index.html")
+            stream_html = render_template("stream.html")
+
+        @self.app.route("/")
+        def index() -> Response:
+            return Response(index_html, mimetype="text/html")
+
+        @self.app.route("/stream")
+        def stream() -> Response:
+            return Response(stream_html, mimetype="text/html")
+
+        @self.app.route("/health")
+        def health() -> Response:
+            # Byte-template interpolation skips jsonify's dict encode
+            return Response(
+                b'{"status":"ok","timestamp":%f}' % time.time(),
+                mimetype="application/json",
+            )
+
+        @self.app.route("/cam.jpg")
+        def camera_snapshot() -> Response:
+            frame = self._frame_callback() if self._frame_callback else None
+            if frame is None:
+                return Response("No frame available", status=503)
+            # Hand werkzeug the camera buffer as-is: direct_passthrough
+            # skips the set_data copy, so a bytearray/memoryview frame
+            # from a camera double-buffer is sent without duplication
+            response = Response(
+                iter((memoryview(frame),)),
+                mimetype="image/jpeg",
+                direct_passthrough=True,
+            )
+            response.headers["Content-Length"] = str(len(frame))
+            return response
+
+        @self.app.route("/cam.mjpg")
+        def camera_stream() -> Response:
+            # One long-lived multipart stream per viewer: each frame is
+            # a generator resume instead of a full WSGI request, which
+            # removes the per-frame routing overhead of polling /cam.jpg
+            if self._frame_callback is None:
+                return Response("No camera configured", status=503)
+
+            def generate():
+                header = b"--frame\r\n" b"Content-Type: image/jpeg\r\n" b"Content-Length: %d\r\n\r\n"
+                # Runs until the viewer disconnects, which closes the
+                # generator via GeneratorExit
+                while True:
+                    frame = self._frame_callback()
+                    if frame is not None:
+                        yield header % len(frame)
+                        # memoryview avoids concatenating header + frame
+                        # into a fresh bytes object per frame
+                        yield memoryview(frame)
+                        yield b"\r\n"
+                    self.socketio.sleep(self.MJPEG_FRAME_INTERVAL)
+
+            return Response(
+                generate(),
+                mimetype="multipart/x-mixed-replace; boundary=frame",
+                direct_passthrough=True,
+            )
+
+    # ------------------------------------------------------------------
+    # SocketIO event handlers
+    # ------------------------------------------------------------------
+
+    def _register_handlers(self) -> None:
+        """Register the SocketIO event handlers."""
+
+        @self.socketio.on("connect")
+        def handle_connect() -> None:
+            sid = request.sid
+            granted = self._control_manager.request_control(sid)
+            if _logger.isEnabledFor(logging.INFO):
+                _logger.info("Client connected: %s (controller=%s)", sid, granted)
+            self.socketio.emit(
+                "control_status",
+                {
+                    "role": self._control_manager.get_user_role(sid).label,
+                    "controller": self._control_manager.active_controller,
+                    "observers": self._control_manager.observer_count,
+                },
+                to=sid,
+            )
+
+        @self.socketio.on("disconnect")
+        def handle_disconnect() -> None:
+            sid = request.sid
+            if _logger.isEnabledFor(logging.INFO):
+                _logger.info("Client disconnected: %s", sid)
+            was_controller = self._control_manager.active_controller == sid
+            self._control_manager.disconnect(sid)
+            with self._watchdog_lock:
+                # The heap entry stays until expiry; clearing the current
+                # deadline marks it stale so the loop just discards it
+                self._watchdog_deadline.pop(sid, None)
+            with self._pending_lock:
+                self._pending.pop(sid, None)
+            if was_controller:
+                # Controller went away, stop the robot
+                self._pending_motor.clear()
+                self._set_motors(0.0, 0.0)
+
+        @self.socketio.on("drive")
+        def handle_drive(data: dict) -> None:
+            sid = request.sid
+            if not self._is_controller.get(sid):
+                return
+            try:
+                left = float(data["left"])
+                right = float(data["right"])
+            except (KeyError, TypeError, ValueError) as e:
+                # Guarded: a client flooding bad input must not pay a
+                # LogRecord allocation per message when WARNING is off
+                if _logger.isEnabledFor(logging.WARNING):
+                    _logger.warning("Invalid drive input: %s", e)
+                return
+            self._feed_watchdog(sid)
+            self._control_manager.update_activity(sid)
+            self._queue_motor_command(left * self._speed_multiplier, right * self._speed_multiplier)
+            self._queue_message(sid, "ack", {"event": "drive", "left": left, "right": right})
+
+        @self.socketio.on("joystick")
+        def handle_joystick(data: dict) -> None:
+            sid = request.sid
+            if not self._is_controller.get(sid):
+                return
+            try:
+                x = float(data["x"])
+                y = float(data["y"])
+            except (KeyError, TypeError, ValueError) as e:
+                if _logger.isEnabledFor(logging.WARNING):
+                    _logger.warning("Invalid joystick input: %s", e)
+                return
+            left, right = joystick_to_motors(x, y)
+            self._feed_watchdog(sid)
+            self._control_manager.update_activity(sid)
+            self._queue_motor_command(left * self._speed_multiplier, right * self._speed_multiplier)
+
+        @self.socketio.on("stop")
+        def handle_stop() -> None:
+            sid = request.sid
+            if not self._is_controller.get(sid):
+                return
+            # Drop any queued command so it cannot be applied after the stop
+            self._pending_motor.clear()
+            self._set_motors(0.0, 0.0)
+            self._queue_message(sid, "ack", {"event": "stop"})
+
+        @self.socketio.on("speed")
+        def handle_speed(data: dict) -> None:
+            sid = request.sid
+            if not self._is_controller.get(sid):
+                return
+            try:
+                multiplier = float(data["multiplier"])
+            except (KeyError, TypeError, ValueError) as e:
+                _logger.warning("Invalid speed input: %s", e)
+                return
+            self._speed_multiplier = max(0.0, min(1.0, multiplier))
+            self._queue_message(sid, "ack", {"event": "speed", "multiplier": self._speed_multiplier})
+
+        @self.socketio.on("input")
+        def handle_input(buf) -> None:
+            # Multiplexed binary fast path for high-rate clients: the
+            # JSON events above stay for the shipped control page, but a
+            # client emitting at joystick rates can pack commands as
+            # struct.pack('<Bff', op, a, b) and skip the JSON parse and
+            # per-event dispatch. No acks are sent on this path.
+            sid = request.sid
+            if not self._is_controller.get(sid):
+                return
+            try:
+                op, a, b = _INPUT_STRUCT.unpack_from(buf)
+            except (struct.error, TypeError):
+                if _logger.isEnabledFor(logging.WARNING):
+                    _logger.warning("Invalid input frame from %s", sid)
+                return
+            if op == _OP_DRIVE:
+                self._feed_watchdog(sid)
+                self._control_manager.update_activity(sid)
+                multiplier = self._speed_multiplier
+                self._queue_motor_command(a * multiplier, b * multiplier)
+            elif op == _OP_JOYSTICK:
+                left, right = joystick_to_motors(a, b)
+                self._feed_watchdog(sid)
+                self._control_manager.update_activity(sid)
+                multiplier = self._speed_multiplier
+                self._queue_motor_command(left * multiplier, right * multiplier)
+            elif op == _OP_STOP:
+                self._pending_motor.clear()
+                self._set_motors(0.0, 0.0)
+            elif op == _OP_SPEED:
+                self._speed_multiplier = max(0.0, min(1.0, a))
+
+        @self.socketio.on("emergency_stop")
+        def handle_emergency_stop(data: Optional[dict] = None) -> None:
+            # ANY user can trigger emergency stop (ADR-009)
+            sid = request.sid
+            reason = "Emergency stop from web"
+            if isinstance(data, dict) and data.get("reason"):
+                reason = str(data["reason"])
+            self._emergency_stop.trigger(sid, reason)
+
+        @self.socketio.on("emergency_reset")
+        def handle_emergency_reset() -> None:
+            sid = request.sid
+            if not self._is_controller.get(sid):
+                return
+            self._emergency_stop.reset(sid)
+
+        @self.socketio.on("request_takeover")
+        def handle_request_takeover() -> None:
+            sid = request.sid
+            if self._control_manager.request_takeover(sid):
+                controller = self._control_manager.active_controller
+                if controller is not None:
+                    self.socketio.emit("takeover_requested", {"requester": sid}, to=controller)
+
+        @self.socketio.on("approve_takeover")
+        def handle_approve_takeover() -> None:
+            self._control_manager.approve_takeover(request.sid)
+
+        @self.socketio.on("take_photo")
+        def handle_take_photo() -> None:
+            sid = request.sid
+            # The frame grab and file write block for milliseconds;
+            # run them off the handler so the connection stays responsive
+            self.socketio.start_background_task(self._take_photo, sid)
+
+    # ------------------------------------------------------------------
+    # Motor control
+    # ------------------------------------------------------------------
+
+    def _set_motors(self, left: float, right: float) -> bool:
+        """Clamp and apply a motor command.
+
+        Commands are refused while the emergency stop is active.
+
+        Args:
+            left: Left motor power, -1.0 to 1.0 (clamped)
+            right: Right motor power, -1.0 to 1.0 (clamped)
+
+        Returns:
+            True if the command was applied, False if refused
+        """
+        if self._emergency_stop.is_stopped and (left != 0.0 or right != 0.0):
+            return False
+        left = max(-1.0, min(1.0, left)) * self._max_power
+        right = max(-1.0, min(1.0, right)) * self._max_power
+        with self._motor_lock:
+            # Each write is a blocking I2C transaction, so skip commands
+            # that barely move, but refresh often enough for the failsafe
+            now = _monotonic_ns()
+            if (
+                abs(left - self._current_left) < self.MOTOR_DELTA
+                and abs(right - self._current_right) < self.MOTOR_DELTA
+                and now - self._last_motor_write < self._motor_refresh_ns
+            ):
+                return True
+            self._current_left = left
+            self._current_right = right
+            self._last_motor_write = now
+            callback = self._motor_callback
+        # The callback is a multi-ms hardware transaction; invoking it
+        # after release keeps the lock to the state update only, so other
+        # handlers never queue behind the bus
+        if callback:
+            try:
+                callback(left, right)
+            except Exception:
+                _logger.exception("Motor callback failed")
+                return False
+        return True
+
+    def _queue_motor_command(self, left: float, right: float) -> None:
+        """Overwrite the pending motor command (latest wins).
+
+        Handlers call this instead of _set_motors so a client emitting
+        faster than MOTOR_APPLY_INTERVAL just replaces the slot; stale
+        commands are never written to the bus. The bounded append evicts
+        the old entry in the same atomic C call, so no lock is taken on
+        this per-command hot path.
+        """
+        self._pending_motor.append((left, right))
+
+    def _motor_apply_loop(self) -> None:
+        """Apply the newest pending motor command at MOTOR_APPLY_INTERVAL."""
+        # Motor control runs at Tier 1 priority (ADR-008), pinned to the
+        # safety core (meaningful under threading mode; under eventlet
+        # all tasks share the serving thread)
+        set_thread_priority(TIER1_PRIORITY)
+        set_thread_affinity(self.SAFETY_CORES)
+        pending = self._pending_motor
+        while self._running:
+            try:
+                command = pending.popleft()
+            except IndexError:
+                command = None
+            if command is not None:
+                self._set_motors(*command)
+            self.socketio.sleep(self.MOTOR_APPLY_INTERVAL)
+
+    def _motors_off(self) -> None:
+        """Stop the motors immediately (emergency stop callback)."""
+        self._pending_motor.clear()
+        with self._motor_lock:
+            self._current_left = 0.0
+            self._current_right = 0.0
+            callback = self._motor_callback
+        if callback:
+            try:
+                callback(0.0, 0.0)
+            except Exception:
+                _logger.exception("Motor callback failed during emergency stop")
+
+    # ------------------------------------------------------------------
+    # Telemetry and message batching
+    # ------------------------------------------------------------------
+
+    def get_telemetry(self) -> dict:
+        """Build the current telemetry snapshot.
+
+        Returns:
+            Dict with motor state, control state, emergency stop state and
+            battery voltage (None if no battery callback is configured).
+        """
+        battery = self._battery_cache
+        now = time.monotonic()
+        if self._battery_callback and now - self._battery_read_time >= 1.0:
+            self._battery_read_time = now
+            try:
+                battery = self._battery_callback()
+            except Exception:
+                _logger.exception("Battery callback failed")
+            else:
+                self._battery_cache = battery
+        return {
+            "left": self._current_left,
+            "right": self._current_right,
+            "speed_multiplier": self._speed_multiplier,
+            "emergency_stopped": self._emergency_stop.is_stopped,
+            "controller": self._control_manager.active_controller,
+            "observers": self._control_manager.observer_count,
+            "battery_voltage": battery,
+            "timestamp": time.time(),
+        }
+
+    def _queue_message(self, sid: str, event: str, data: dict) -> None:
+        """Append a message to a client's pending batch.
+
+        The batch is flushed by _flush_loop every BATCH_FLUSH_INTERVAL, or
+        immediately if the pending list hits BATCH_MAX_PENDING.
+        """
+        flush_now = False
+        with self._pending_lock:
+            pending = self._pending[sid]
+            pending.append((event, data))
+            if len(pending) >= self.BATCH_MAX_PENDING:
+                flush_now = True
+        if flush_now:
+            self._flush_pending()
+
+    def _flush_pending(self) -> None:
+        """Emit each client's pending messages as one batch message."""
+        with self._pending_lock:
+            if not self._pending:
+                return
+            batches = self._pending
+            self._pending = defaultdict(list)
+        for sid, messages in batches.items():
+            if messages:
+                self.socketio.emit("batch", messages, to=sid)
+
+    def _send_telemetry(self, sid: Optional[str] = None) -> None:
+        """Send a telemetry update to one client or all connected clients.
+
+        The broadcast path is a single emit: the payload is serialized
+        once and the encoded packet is shared across every recipient,
+        instead of queuing a copy into each client's batch and paying one
+        JSON encode per client per tick.
+        """
+        telemetry = self.get_telemetry()
+        if sid is not None:
+            self._queue_message(sid, "telemetry", telemetry)
+            return
+        self.socketio.emit("batch", [("telemetry", telemetry)])
+
+    # ------------------------------------------------------------------
+    # Background loops
+    # ------------------------------------------------------------------
+
+    def _telemetry_loop(self) -> None:
+        """Broadcast telemetry until stopped, skipping unchanged ticks.
+
+        Changed values go out at TELEMETRY_INTERVAL; while nothing moves
+        the loop only re-broadcasts at TELEMETRY_IDLE_INTERVAL as a
+        keepalive. A motor command changes the snapshot, which snaps the
+        cadence back to full rate on the next tick.
+        """
+        # Telemetry is part of the web tier (ADR-008)
+        set_thread_priority(TIER3_PRIORITY)
+        # socketio.sleep yields cooperatively under eventlet (a plain
+        # time.sleep would stall every greenlet) and is time.sleep under
+        # threading mode
+        last_key = None
+        last_emit = 0.0
+        while self._running:
+            telemetry = self.get_telemetry()
+            # Everything except the timestamp, which changes every tick
+            key = (
+                telemetry["left"],
+                telemetry["right"],
+                telemetry["speed_multiplier"],
+                telemetry["emergency_stopped"],
+                telemetry["controller"],
+                telemetry["observers"],
+                telemetry["battery_voltage"],
+            )
+            now = time.monotonic()
+            if key != last_key or now - last_emit >= self.TELEMETRY_IDLE_INTERVAL:
+                last_key = key
+                last_emit = now
+                self.socketio.emit("batch", [("telemetry", telemetry)])
+            self.socketio.sleep(self.TELEMETRY_INTERVAL)
+
+    def _flush_loop(self) -> None:
+        """Flush pending message batches at BATCH_FLUSH_INTERVAL."""
+        while self._running:
+            self._flush_pending()
+            self.socketio.sleep(self.BATCH_FLUSH_INTERVAL)
+
+    def _feed_watchdog(self, sid: str) -> None:
+        """Push a fresh command deadline for a client.
+
+        O(log N) heap push; the entry a previous command pushed becomes
+        stale and is discarded when the watchdog pops it.
+        """
+        deadline = _monotonic_ns() + self._command_timeout_ns
+        with self._watchdog_lock:
+            if sid not in self._watchdog_deadline and len(self._watchdog_deadline) >= self.WATCHDOG_MAX_CLIENTS:
+                # Evict the longest-tracked client; its heap entry turns
+                # stale and is discarded on pop. Loud on purpose - this
+                # only fires under a reconnect flood.
+                evicted = next(iter(self._watchdog_deadline))
+                del self._watchdog_deadline[evicted]
+                _logger.warning("Watchdog client cap reached; evicted %s", evicted)
+            self._watchdog_deadline[sid] = deadline
+            heapq.heappush(self._watchdog_heap, (deadline, sid))
+
+    def _watchdog_loop(self) -> None:
+        """Stop the motors when a driving client goes quiet (ADR-009 Layer 2)."""
+        # The watchdog is a safety layer, so it runs at Tier 1 (ADR-008)
+        # on the safety core, keeping its tick jitter independent of
+        # socket bursts on the web cores
+        set_thread_priority(TIER1_PRIORITY)
+        set_thread_affinity(self.SAFETY_CORES)
+        while self._running:
+            now = _monotonic_ns()
+            expired = []
+            with self._watchdog_lock:
+                heap = self._watchdog_heap
+                while heap and heap[0][0] <= now:
+                    deadline, sid = heapq.heappop(heap)
+                    # Only the newest entry per client counts; older ones
+                    # (and disconnected clients) are stale
+                    if self._watchdog_deadline.get(sid) == deadline:
+                        del self._watchdog_deadline[sid]
+                        expired.append(sid)
+            for sid in expired:
+                if self._current_left != 0.0 or self._current_right != 0.0:
+                    _logger.warning("Watchdog: no commands from %s, stopping motors", sid)
+                    self._set_motors(0.0, 0.0)
+            self.socketio.sleep(self.WATCHDOG_INTERVAL)
+
+    # ------------------------------------------------------------------
+    # Safety callbacks
+    # ------------------------------------------------------------------
+
+    def _on_control_change(self, user_id: str, new_role: UserRole) -> None:
+        """Notify a user that their control role changed."""
+        if new_role == UserRole.DISCONNECTED:
+            self._is_controller.pop(user_id, None)
+            return
+        self._is_controller[user_id] = new_role is UserRole.CONTROLLER
+        self.socketio.emit("control_change", {"role": new_role.label}, to=user_id)
+
+    def _on_emergency_change(self, is_stopped: bool, reason: str) -> None:
+        """Broadcast emergency stop state changes (unbatched, latency-critical)."""
+        self.socketio.emit("emergency", {"stopped": is_stopped, "reason": reason})
+
+    # ------------------------------------------------------------------
+    # Photos
+    # ------------------------------------------------------------------
+
+    def _take_photo(self, sid: str) -> None:
+        """Save the current camera frame to the photo directory."""
+        frame = self._frame_callback() if self._frame_callback else None
+        if frame is None:
+            self.socketio.emit("photo_error", {"error": "No frame available"}, to=sid)
+            return
+        try:
+            os.makedirs(self._photo_base, exist_ok=True)
+            filename = "Photo_%s.jpg" % datetime.datetime.utcnow().strftime("%Y%m%d_%H%M%S")
+            filepath = self._photo_base / filename
+            # The name is generated server-side from strftime, so this
+            # traversal check is defense in depth against future call
+            # sites; __debug__ lets python -O drop it entirely
+            if __debug__ and filepath.resolve().parent != self._photo_base:
+                raise ValueError("Invalid photo path")
+            with open(filepath, "wb") as f:
+                f.write(frame)
+            self.socketio.emit("photo_saved", {"filename": filename}, to=sid)
+        except (IOError, OSError, ValueError) as e:
+            _logger.error("Photo save error: %s", e)
+            self.socketio.emit("photo_error", {"error": "Failed to save photo"}, to=sid)
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+
+    def run(self) -> None:
+        """Start the background loops and serve until interrupted."""
+        self._running = True
+        # start_background_task picks the right primitive per async mode:
+        # plain threads never get scheduled (and their emits silently
+        # drop) once eventlet has monkey-patched the process
+        self.socketio.start_background_task(self._telemetry_loop)
+        self.socketio.start_background_task(self._watchdog_loop)
+        self.socketio.start_background_task(self._motor_apply_loop)
+        self.socketio.start_background_task(self._flush_loop)
+        if self._host == "0.0.0.0":  # nosec - deliberate operator choice
+            _logger.warning("Server is exposed on ALL network interfaces!")
+        # Keep the serving thread (and, under eventlet, every greenlet on
+        # it) off the safety core so L1/L2 caches stay hot and a socket
+        # burst never competes with the stop path
+        set_thread_affinity(self.WEB_CORES)
+        self.socketio.run(self.app, host=self._host, port=self._port)
+
+    def stop(self) -> None:
+        """Stop the background loops and the motors."""
+        self._running = False
+        self._set_motors(0.0, 0.0)
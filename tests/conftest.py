@@ -0,0 +1,19 @@
+# coding: utf-8
+"""Shared pytest configuration for the test suite."""
+
+import importlib.util
+
+# Skip the web module at collection time when flask_socketio is not
+# installed. importorskip inside the module still pays for importing and
+# partially executing the file on every run; collect_ignore means pytest
+# never opens it.
+collect_ignore = ["test_web.py"] if importlib.util.find_spec("flask_socketio") is None else []
+
+
+def pytest_configure(config) -> None:
+    """Register custom markers (no pytest.ini in this repo)."""
+    config.addinivalue_line("markers", "web: tests requiring the flask_socketio web stack")
+    config.addinivalue_line(
+        "markers",
+        "benchmark: tests asserting on wall-clock timing; deselect with " '-m "not benchmark" on loaded machines',
+    )
@@ -1,7 +1,6 @@
 # coding: utf-8
 """Tests for safety module."""
 
-import threading
 import time
 
 import pytest
@@ -10,49 +9,75 @@ from src.safety.control_manager import ControlManager, UserRole
 from src.safety.emergency_stop import EmergencyStop
 
 
+@pytest.fixture(scope="module")
+def _shared_estop() -> EmergencyStop:
+    """One EmergencyStop for the whole module; tests reset it, which is
+    cheaper than re-running the constructor (locks, condition, history
+    ring) per test."""
+    return EmergencyStop()
+
+
+@pytest.fixture
+def estop(_shared_estop: EmergencyStop) -> EmergencyStop:
+    """The shared EmergencyStop, returned to its initial state after
+    each test."""
+    yield _shared_estop
+    _shared_estop._stopped.clear()
+    _shared_estop._history.clear()
+
+
+@pytest.fixture(scope="module")
+def _shared_manager() -> ControlManager:
+    """One ControlManager for the whole module (see _shared_estop)."""
+    return ControlManager()
+
+
+@pytest.fixture
+def manager(_shared_manager: ControlManager) -> ControlManager:
+    """The shared ControlManager, emptied through its public batch
+    disconnect after each test."""
+    yield _shared_manager
+    _shared_manager.disconnect_many(list(_shared_manager._sessions))
+
+
 class TestEmergencyStop:
     """Tests for EmergencyStop class."""
 
-    def test_initial_state(self) -> None:
+    def test_initial_state(self, estop: EmergencyStop) -> None:
         """Test that emergency stop is not active initially."""
-        estop = EmergencyStop()
         assert estop.is_stopped is False
 
-    def test_trigger_sets_stopped(self) -> None:
+    def test_trigger_sets_stopped(self, estop: EmergencyStop) -> None:
         """Test that triggering sets stopped state."""
-        estop = EmergencyStop()
         estop.trigger("test_user", "Test trigger")
         assert estop.is_stopped is True
 
     def test_trigger_calls_callback(self) -> None:
         """Test that triggering calls motor stop callback."""
-        callback_called = threading.Event()
-
-        def motor_stop() -> None:
-            callback_called.set()
+        # trigger runs the callback synchronously on the calling thread,
+        # so a plain flag is enough - no Event machinery needed
+        calls = []
 
-        estop = EmergencyStop(motor_stop_callback=motor_stop)
+        # Local construction: the callback is wired in the constructor
+        estop = EmergencyStop(motor_stop_callback=lambda: calls.append(True))
         estop.trigger()
-        assert callback_called.is_set()
+        assert calls == [True]
 
-    def test_reset_clears_stopped(self) -> None:
+    def test_reset_clears_stopped(self, estop: EmergencyStop) -> None:
         """Test that reset clears stopped state."""
-        estop = EmergencyStop()
         estop.trigger()
         assert estop.is_stopped is True
         result = estop.reset("admin")
         assert result is True
         assert estop.is_stopped is False
 
-    def test_reset_when_not_stopped(self) -> None:
+    def test_reset_when_not_stopped(self, estop: EmergencyStop) -> None:
         """Test that reset returns False when not stopped."""
-        estop = EmergencyStop()
         result = estop.reset()
         assert result is False
 
-    def test_history_recording(self) -> None:
+    def test_history_recording(self, estop: EmergencyStop) -> None:
         """Test that events are recorded in history."""
-        estop = EmergencyStop()
         estop.trigger("user1", "First stop")
         estop.reset("admin")
         estop.trigger("user2", "Second stop")
@@ -62,10 +87,8 @@ class TestEmergencyStop:
         assert history[0].triggered_by == "user1"
         assert history[0].reason == "First stop"
 
-    def test_any_user_can_trigger(self) -> None:
+    def test_any_user_can_trigger(self, estop: EmergencyStop) -> None:
         """Test that any user can trigger emergency stop (safety feature)."""
-        estop = EmergencyStop()
-
         # Simulate multiple users triggering
         for i, user in enumerate(["controller", "observer1", "observer2", "random_user"]):
             # Reset before each iteration (except first, since not triggered yet)
@@ -74,23 +97,23 @@ class TestEmergencyStop:
             estop.trigger(user, f"Stop by {user}")
             assert estop.is_stopped is True
 
-    def test_wait_for_reset_timeout_zero(self) -> None:
+    @pytest.mark.benchmark
+    def test_wait_for_reset_timeout_zero(self, estop: EmergencyStop) -> None:
         """Test that timeout=0 returns immediately without sleeping."""
-        estop = EmergencyStop()
         estop.trigger("test", "Test stop")
 
-        # timeout=0 should return False immediately since still stopped
-        start = time.time()
+        # timeout=0 should return False immediately since still stopped.
+        # perf_counter_ns is the high-resolution monotonic clock - unlike
+        # time.time it cannot jump with the wall clock mid-measurement.
+        start = time.perf_counter_ns()
         result = estop.wait_for_reset(timeout=0)
-        elapsed = time.time() - start
+        elapsed_ns = time.perf_counter_ns() - start
 
         assert result is False
-        assert elapsed < 0.01  # Should be nearly instant
+        assert elapsed_ns < 1_000_000  # Should be nearly instant (<1ms)
 
-    def test_wait_for_reset_timeout_zero_not_stopped(self) -> None:
+    def test_wait_for_reset_timeout_zero_not_stopped(self, estop: EmergencyStop) -> None:
         """Test that timeout=0 returns True when not stopped."""
-        estop = EmergencyStop()
-
         # Not stopped, so should return True immediately
         result = estop.wait_for_reset(timeout=0)
         assert result is True
@@ -99,25 +122,22 @@ class TestEmergencyStop:
 class TestControlManager:
     """Tests for ControlManager class."""
 
-    def test_first_user_gets_control(self) -> None:
+    def test_first_user_gets_control(self, manager: ControlManager) -> None:
         """Test that first user requesting control gets it."""
-        manager = ControlManager()
         result = manager.request_control("user1")
         assert result is True
         assert manager.active_controller == "user1"
 
-    def test_second_user_becomes_observer(self) -> None:
+    def test_second_user_becomes_observer(self, manager: ControlManager) -> None:
         """Test that second user becomes observer."""
-        manager = ControlManager()
         manager.request_control("user1")
         result = manager.request_control("user2")
         assert result is False
         assert manager.get_user_role("user2") == UserRole.OBSERVER
         assert manager.observer_count == 1
 
-    def test_controller_disconnect_promotes_observer(self) -> None:
+    def test_controller_disconnect_promotes_observer(self, manager: ControlManager) -> None:
         """Test that when controller disconnects, observer is promoted."""
-        manager = ControlManager()
         manager.request_control("user1")
         manager.request_control("user2")
 
@@ -126,9 +146,20 @@ class TestControlManager:
         assert manager.active_controller == "user2"
         assert manager.get_user_role("user2") == UserRole.CONTROLLER
 
-    def test_takeover_request(self) -> None:
+    def test_disconnect_many_promotes_single_observer(self, manager: ControlManager) -> None:
+        """Test that a batch disconnect promotes one remaining observer."""
+        manager.request_control("user1")
+        manager.request_control("user2")
+        manager.request_control("user3")
+
+        manager.disconnect_many(["user1", "user2"])
+
+        assert manager.active_controller == "user3"
+        assert manager.get_user_role("user3") == UserRole.CONTROLLER
+        assert manager.observer_count == 0
+
+    def test_takeover_request(self, manager: ControlManager) -> None:
         """Test takeover request flow."""
-        manager = ControlManager()
         manager.request_control("user1")
         manager.request_control("user2")
 
@@ -141,16 +172,14 @@ class TestControlManager:
         assert result is True
         assert manager.active_controller == "user2"
 
-    def test_controller_cannot_request_takeover(self) -> None:
+    def test_controller_cannot_request_takeover(self, manager: ControlManager) -> None:
         """Test that current controller cannot request takeover."""
-        manager = ControlManager()
         manager.request_control("user1")
         result = manager.request_takeover("user1")
         assert result is False
 
-    def test_takeover_rejected_when_pending(self) -> None:
+    def test_takeover_rejected_when_pending(self, manager: ControlManager) -> None:
         """Test that new takeover request is rejected when one is pending."""
-        manager = ControlManager()
         manager.request_control("user1")
         manager.request_control("user2")
         manager.request_control("user3")
@@ -164,9 +193,8 @@ class TestControlManager:
         result = manager.request_takeover("user3")
         assert result is False
 
-    def test_approve_takeover_fails_when_requester_disconnected(self) -> None:
+    def test_approve_takeover_fails_when_requester_disconnected(self, manager: ControlManager) -> None:
         """Test that approve_takeover fails if requester has disconnected."""
-        manager = ControlManager()
         manager.request_control("user1")
         manager.request_control("user2")
 
@@ -181,9 +209,8 @@ class TestControlManager:
         assert result is False
         assert manager.has_pending_takeover() is False
 
-    def test_disconnect_clears_pending_takeover(self) -> None:
+    def test_disconnect_clears_pending_takeover(self, manager: ControlManager) -> None:
         """Test that disconnect clears pending takeover request."""
-        manager = ControlManager()
         manager.request_control("user1")
         manager.request_control("user2")
 
@@ -197,9 +224,8 @@ class TestControlManager:
         # Takeover request should be cleared
         assert manager.has_pending_takeover() is False
 
-    def test_cancel_takeover(self) -> None:
+    def test_cancel_takeover(self, manager: ControlManager) -> None:
         """Test canceling a takeover request."""
-        manager = ControlManager()
         manager.request_control("user1")
         manager.request_control("user2")
 
@@ -212,9 +238,8 @@ class TestControlManager:
         assert result is True
         assert manager.has_pending_takeover() is False
 
-    def test_controller_can_deny_takeover(self) -> None:
+    def test_controller_can_deny_takeover(self, manager: ControlManager) -> None:
         """Test that controller can deny (cancel) a takeover request."""
-        manager = ControlManager()
         manager.request_control("user1")
         manager.request_control("user2")
 
@@ -228,9 +253,8 @@ class TestControlManager:
         # User1 still has control
         assert manager.active_controller == "user1"
 
-    def test_non_connected_user_cannot_request_takeover(self) -> None:
+    def test_non_connected_user_cannot_request_takeover(self, manager: ControlManager) -> None:
         """Test that a user who hasn't connected cannot request takeover."""
-        manager = ControlManager()
         manager.request_control("user1")
 
         # User2 never connected, tries to request takeover
@@ -238,9 +262,8 @@ class TestControlManager:
         assert result is False
         assert manager.has_pending_takeover() is False
 
-    def test_approve_takeover_fails_when_no_request_pending(self) -> None:
+    def test_approve_takeover_fails_when_no_request_pending(self, manager: ControlManager) -> None:
         """Test that approve_takeover fails when no takeover request is pending."""
-        manager = ControlManager()
         manager.request_control("user1")
         manager.request_control("user2")
 
@@ -251,9 +274,8 @@ class TestControlManager:
         result = manager.approve_takeover("user1")
         assert result is False
 
-    def test_non_controller_cannot_approve_takeover(self) -> None:
+    def test_non_controller_cannot_approve_takeover(self, manager: ControlManager) -> None:
         """Test that only the controller can approve a takeover request."""
-        manager = ControlManager()
         manager.request_control("user1")
         manager.request_control("user2")
         manager.request_control("user3")
@@ -0,0 +1,78 @@
+# coding: utf-8
+"""Tests for scheduling helpers."""
+
+import threading
+
+from src.core.scheduling import (
+    TIER1_PRIORITY,
+    TIER2_PRIORITY,
+    TIER3_PRIORITY,
+    PeriodicScheduler,
+    set_thread_affinity,
+    set_thread_priority,
+)
+
+
+def test_tier_ordering() -> None:
+    """Test that the ADR-008 tiers are ordered highest to lowest."""
+    assert TIER1_PRIORITY > TIER2_PRIORITY > TIER3_PRIORITY
+
+
+def test_set_thread_priority_never_raises() -> None:
+    """Test that the helper degrades gracefully without privileges."""
+    result = set_thread_priority(TIER3_PRIORITY)
+    assert isinstance(result, bool)
+
+
+def test_set_thread_affinity_never_raises() -> None:
+    """Test that affinity errors are swallowed and reported as False."""
+    result = set_thread_affinity({0})
+    assert isinstance(result, bool)
+
+
+def test_periodic_scheduler_runs_callback() -> None:
+    """Test that a registered task fires repeatedly on its interval."""
+    fired = threading.Event()
+    count = [0]
+
+    def task() -> None:
+        count[0] += 1
+        if count[0] >= 3:
+            fired.set()
+
+    scheduler = PeriodicScheduler()
+    scheduler.add(task, interval=0.01)
+    scheduler.start()
+    try:
+        assert fired.wait(timeout=2.0)
+    finally:
+        scheduler.terminate()
+        scheduler.join(timeout=2.0)
+    assert not scheduler.is_alive()
+
+
+def test_periodic_scheduler_survives_failing_task() -> None:
+    """Test that an exception in one task does not stop the others."""
+    fired = threading.Event()
+
+    def bad_task() -> None:
+        raise RuntimeError("boom")
+
+    scheduler = PeriodicScheduler()
+    scheduler.add(bad_task, interval=0.01)
+    scheduler.add(fired.set, interval=0.01)
+    scheduler.start()
+    try:
+        assert fired.wait(timeout=2.0)
+    finally:
+        scheduler.terminate()
+        scheduler.join(timeout=2.0)
+
+
+def test_periodic_scheduler_terminate_with_empty_wheel() -> None:
+    """Test that terminate wakes a scheduler with no tasks registered."""
+    scheduler = PeriodicScheduler()
+    scheduler.start()
+    scheduler.terminate()
+    scheduler.join(timeout=2.0)
+    assert not scheduler.is_alive()
@@ -2,62 +2,102 @@
 """Tests for settings loader."""
 
 import json
-import tempfile
 from pathlib import Path
+from typing import Any, Dict
 
 import pytest
 
 from src.core.settings import ConfigurationError, Settings, load_config
 
 
+@pytest.fixture(scope="session")
+def base_config_dict() -> Dict[str, Any]:
+    """A full valid config built once for the whole session.
+
+    Tests that need different values copy it and override just the
+    sections they touch instead of rebuilding the ~40-line dict.
+    """
+    return {
+        "security": {"webBindAddress": "127.0.0.1", "webPort": 8080},
+        "power": {"voltageIn": 12.0, "voltageOut": 11.4},
+        "camera": {
+            "width": 640,
+            "height": 480,
+            "frameRate": 30,
+            "flippedImage": True,
+        },
+        "processing": {
+            "scaledWidth": 160,
+            "scaledHeight": 120,
+            "processingThreads": 4,
+            "minHuntColour": [80, 0, 0],
+            "maxHuntColour": [255, 100, 100],
+            "erodeSize": 5,
+        },
+        "control": {
+            "motorSmoothing": 5,
+            "positionP": 1.0,
+            "positionI": 0.0,
+            "positionD": 0.4,
+            "changeP": 1.0,
+            "changeI": 0.0,
+            "changeD": 0.4,
+            "clipI": 100,
+        },
+        "drive": {
+            "steeringGain": 1.0,
+            "steeringClip": 1.0,
+            "steeringOffset": 0.0,
+        },
+        "debug": {"showFps": True, "testMode": True, "showImages": True},
+        "safety": {
+            "batteryStopVoltage": 10.5,
+            "batteryWarningVoltage": 11.0,
+            "watchdogTimeoutSeconds": 1.0,
+            "emergencyStopEnabled": True,
+        },
+    }
+
+
+@pytest.fixture(scope="session")
+def base_config_bytes(base_config_dict: Dict[str, Any]) -> bytes:
+    """The base config serialised once; tests write these bytes straight
+    to disk instead of re-running json.dumps per test."""
+    return json.dumps(base_config_dict).encode()
+
+
+@pytest.fixture
+def config_file(tmp_path: Path, base_config_bytes: bytes) -> Path:
+    """A config.json on disk containing the base config."""
+    path = tmp_path / "config.json"
+    path.write_bytes(base_config_bytes)
+    return path
+
+
+@pytest.fixture
+def settings_sandbox() -> None:
+    """Snapshot the Settings class state and restore it afterwards.
+
+    Settings holds its values as class attributes, so a test that calls
+    Settings.load would otherwise leak the test config into every later
+    test. The snapshot keeps plain data attributes (including _loaded
+    and _config) and skips methods and descriptors.
+    """
+    saved = {
+        name: value
+        for name, value in vars(Settings).items()
+        if not name.startswith("__") and not isinstance(value, (classmethod, staticmethod, property))
+    }
+    yield
+    for name, value in saved.items():
+        setattr(Settings, name, value)
+
+
 class TestLoadConfig:
     """Tests for load_config function."""
 
-    def test_load_valid_config(self, tmp_path: Path) -> None:
+    def test_load_valid_config(self, config_file: Path) -> None:
         """Test loading a valid configuration file."""
-        config_file = tmp_path / "config.json"
-        config_data = {
-            "security": {"webBindAddress": "127.0.0.1", "webPort": 8080},
-            "power": {"voltageIn": 12.0, "voltageOut": 11.4},
-            "camera": {
-                "width": 640,
-                "height": 480,
-                "frameRate": 30,
-                "flippedImage": True,
-            },
-            "processing": {
-                "scaledWidth": 160,
-                "scaledHeight": 120,
-                "processingThreads": 4,
-                "minHuntColour": [80, 0, 0],
-                "maxHuntColour": [255, 100, 100],
-                "erodeSize": 5,
-            },
-            "control": {
-                "motorSmoothing": 5,
-                "positionP": 1.0,
-                "positionI": 0.0,
-                "positionD": 0.4,
-                "changeP": 1.0,
-                "changeI": 0.0,
-                "changeD": 0.4,
-                "clipI": 100,
-            },
-            "drive": {
-                "steeringGain": 1.0,
-                "steeringClip": 1.0,
-                "steeringOffset": 0.0,
-            },
-            "debug": {"showFps": True, "testMode": True, "showImages": True},
-            "safety": {
-                "batteryStopVoltage": 10.5,
-                "batteryWarningVoltage": 11.0,
-                "watchdogTimeoutSeconds": 1.0,
-                "emergencyStopEnabled": True,
-            },
-        }
-        config_file.write_text(json.dumps(config_data))
-
         result = load_config(config_file)
         assert result["security"]["webBindAddress"] == "127.0.0.1"
         assert result["camera"]["frameRate"] == 30
@@ -75,13 +115,14 @@ class TestLoadConfig:
         with pytest.raises(json.JSONDecodeError):
             load_config(config_file)
 
-    def test_missing_required_section(self, tmp_path: Path) -> None:
-        """Test that missing required section raises ConfigurationError."""
+    @pytest.mark.parametrize(
+        "missing_section",
+        ["security", "power", "camera", "processing", "control", "drive", "debug", "safety"],
+    )
+    def test_missing_required_section(self, tmp_path: Path, base_config_dict: Dict[str, Any], missing_section: str) -> None:
+        """Test that each missing required section raises ConfigurationError."""
+        config_data = {key: value for key, value in base_config_dict.items() if key != missing_section}
         config_file = tmp_path / "incomplete.json"
-        config_data = {
-            "security": {"webBindAddress": "127.0.0.1"},
-            # Missing other required sections
-        }
         config_file.write_text(json.dumps(config_data))
         with pytest.raises(ConfigurationError, match="Missing required config section"):
             load_config(config_file)
@@ -97,67 +138,32 @@ class TestSettings:
         assert Settings.frameRate > 0
         assert Settings.testMode in (True, False)
 
-    def test_settings_reload(self, tmp_path: Path) -> None:
+    def test_settings_reload(
+        self,
+        tmp_path: Path,
+        base_config_dict: Dict[str, Any],
+        settings_sandbox: None,
+    ) -> None:
         """Test that Settings can reload configuration."""
-        # Save original state to restore after test
-        original_loaded = Settings._loaded
-        original_config = Settings._config.copy() if Settings._config else None
-
-        try:
-            # Create a test config
-            config_file = tmp_path / "config.json"
-            config_data = {
-                "security": {"webBindAddress": "192.168.1.1", "webPort": 9090},
-                "power": {"voltageIn": 12.0, "voltageOut": 11.4},
-                "camera": {
-                    "width": 320,
-                    "height": 240,
-                    "frameRate": 15,
-                    "flippedImage": False,
-                },
-                "processing": {
-                    "scaledWidth": 80,
-                    "scaledHeight": 60,
-                    "processingThreads": 2,
-                    "minHuntColour": [0, 0, 0],
-                    "maxHuntColour": [255, 255, 255],
-                    "erodeSize": 3,
-                },
-                "control": {
-                    "motorSmoothing": 3,
-                    "positionP": 0.5,
-                    "positionI": 0.1,
-                    "positionD": 0.2,
-                    "changeP": 0.5,
-                    "changeI": 0.1,
-                    "changeD": 0.2,
-                    "clipI": 50,
-                },
-                "drive": {
-                    "steeringGain": 0.8,
-                    "steeringClip": 0.9,
-                    "steeringOffset": 0.1,
-                },
-                "debug": {"showFps": False, "testMode": False, "showImages": False},
-                "safety": {
-                    "batteryStopVoltage": 10.0,
-                    "batteryWarningVoltage": 10.5,
-                    "watchdogTimeoutSeconds": 2.0,
-                    "emergencyStopEnabled": False,
-                },
-            }
-            config_file.write_text(json.dumps(config_data))
-
-            # Load the test config
-            Settings._loaded = False
-            Settings.load(config_file)
-
-            assert Settings.webBindAddress == "192.168.1.1"
-            assert Settings.frameRate == 15
-            assert Settings.testMode is False
-        finally:
-            # Restore original Settings state to avoid affecting other tests
-            Settings._loaded = original_loaded
-            if original_config is not None:
-                Settings._config = original_config
-                Settings._apply_config(original_config)
+        # Base config with only the fields this test asserts changed
+        config_data = {
+            **base_config_dict,
+            "security": {"webBindAddress": "192.168.1.1", "webPort": 9090},
+            "camera": {
+                **base_config_dict["camera"],
+                "width": 320,
+                "height": 240,
+                "frameRate": 15,
+                "flippedImage": False,
+            },
+            "debug": {"showFps": False, "testMode": False, "showImages": False},
+        }
+        config_file = tmp_path / "config.json"
+        config_file.write_text(json.dumps(config_data))
+
+        Settings._loaded = False
+        Settings.load(config_file)
+
+        assert Settings.webBindAddress == "192.168.1.1"
+        assert Settings.frameRate == 15
+        assert Settings.testMode is False
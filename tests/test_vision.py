@@ -0,0 +1,52 @@
+# coding: utf-8
+"""Tests for vision module."""
+
+import numpy as np
+
+from src.vision.hunt_numba import row_centroids, threshold_colour, warm_up
+
+
+class TestThresholdColour:
+    """Tests for threshold_colour."""
+
+    def test_pixels_in_range_are_set(self) -> None:
+        """Test that pixels inside the colour range become 255."""
+        frame = np.zeros((4, 4, 3), np.uint8)
+        frame[1, 2] = (100, 50, 50)
+        mask = threshold_colour(frame, (80, 0, 0), (255, 100, 100))
+        assert mask[1, 2] == 255
+
+    def test_pixels_out_of_range_are_clear(self) -> None:
+        """Test that pixels outside the colour range stay 0."""
+        frame = np.full((4, 4, 3), (10, 200, 10), np.uint8)
+        mask = threshold_colour(frame, (80, 0, 0), (255, 100, 100))
+        assert not mask.any()
+
+    def test_mask_shape_and_dtype(self) -> None:
+        """Test that the mask matches the frame size with uint8 dtype."""
+        frame = np.zeros((6, 8, 3), np.uint8)
+        mask = threshold_colour(frame, (0, 0, 0), (255, 255, 255))
+        assert mask.shape == (6, 8)
+        assert mask.dtype == np.uint8
+
+
+class TestRowCentroids:
+    """Tests for row_centroids."""
+
+    def test_centroid_of_line_segment(self) -> None:
+        """Test that the centroid of a run of set pixels is its middle."""
+        mask = np.zeros((6, 10), np.uint8)
+        mask[4, 3:7] = 255
+        cx1, cx2 = row_centroids(mask, 4, 1)
+        assert cx1 == 4.5
+        assert cx2 == -1.0
+
+    def test_empty_rows_return_negative(self) -> None:
+        """Test that rows without any line report -1.0."""
+        mask = np.zeros((6, 10), np.uint8)
+        assert row_centroids(mask, 0, 5) == (-1.0, -1.0)
+
+
+def test_warm_up_runs() -> None:
+    """Test that warm_up compiles/executes the kernels without error."""
+    warm_up()
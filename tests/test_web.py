@@ -0,0 +1,212 @@
+# coding: utf-8
+"""Tests for web module."""
+
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.web.monster_web_server import MonsterWebServer, joystick_to_motors
+
+# conftest.py drops this file from collection when flask_socketio is missing
+pytestmark = pytest.mark.web
+
+
+@pytest.fixture(scope="module")
+def _shared_server() -> MonsterWebServer:
+    """One MonsterWebServer for the whole module.
+
+    Constructing the server builds a Flask app, registers routes and a
+    SocketIO instance - by far the slowest setup in this module - so it
+    happens once; tests inject callbacks by assignment and the server
+    fixture resets the mutable state afterwards.
+    """
+    return MonsterWebServer()
+
+
+@pytest.fixture
+def server(_shared_server: MonsterWebServer) -> MonsterWebServer:
+    """The shared server, returned to its constructed state after each
+    test (callbacks, motor state, batches, emergency stop, mocks)."""
+    yield _shared_server
+    s = _shared_server
+    s._motor_callback = None
+    s._frame_callback = None
+    s._battery_callback = None
+    s._max_power = 1.0
+    s._current_left = 0.0
+    s._current_right = 0.0
+    s._speed_multiplier = 1.0
+    s._last_motor_write = 0
+    s._battery_cache = None
+    s._battery_read_time = 0.0
+    s._pending.clear()
+    s._pending_motor.clear()
+    s._emergency_stop._stopped.clear()
+    s._emergency_stop._history.clear()
+
+
+@pytest.fixture(scope="module")
+def client(_shared_server: MonsterWebServer):
+    """One Flask test client for the module's route tests."""
+    return _shared_server.app.test_client()
+
+
+@pytest.fixture(scope="module")
+def _shared_emit_mock() -> MagicMock:
+    """One MagicMock standing in for socketio.emit across the module."""
+    return MagicMock()
+
+
+@pytest.fixture
+def emit_mock(server: MonsterWebServer, _shared_emit_mock: MagicMock) -> MagicMock:
+    """The shared emit mock installed over socketio.emit for one test.
+
+    patch.object restores the real bound method even if the test raises,
+    so no manual cleanup of the instance dict is needed."""
+    with patch.object(server.socketio, "emit", _shared_emit_mock):
+        yield _shared_emit_mock
+    _shared_emit_mock.reset_mock()
+
+
+@pytest.fixture(scope="module")
+def pool():
+    """Shared worker pool for concurrency tests - reusing workers skips
+    the per-test thread spawn cost."""
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        yield executor
+
+
+class TestJoystickToMotorConversion:
+    """Tests for joystick_to_motors conversion."""
+
+    @pytest.mark.parametrize(
+        ("x", "y", "expected_left", "expected_right"),
+        [
+            pytest.param(0.0, 1.0, 1.0, 1.0, id="full_forward"),
+            pytest.param(0.0, -1.0, -1.0, -1.0, id="full_reverse"),
+            pytest.param(-1.0, 0.0, -1.0, 1.0, id="spin_left"),
+            pytest.param(1.0, 0.0, 1.0, -1.0, id="spin_right"),
+            pytest.param(0.0, 0.0, 0.0, 0.0, id="centered"),
+            pytest.param(1.0, 1.0, 1.0, 0.0, id="diagonal_normalized"),
+        ],
+    )
+    def test_conversion(self, x: float, y: float, expected_left: float, expected_right: float) -> None:
+        """Test the stick-position to motor-pair mapping."""
+        left, right = joystick_to_motors(x, y)
+        assert left == pytest.approx(expected_left)
+        assert right == pytest.approx(expected_right)
+
+
+class TestMonsterWebServer:
+    """Tests for MonsterWebServer class."""
+
+    def test_health_endpoint(self, client) -> None:
+        """Test that /health reports ok with a timestamp."""
+        response = client.get("/health")
+        assert response.status_code == 200
+        data = response.get_json()
+        assert data["status"] == "ok"
+        assert data["timestamp"] > 0
+
+    def test_camera_snapshot_no_frame(self, server: MonsterWebServer, client) -> None:
+        """Test that /cam.jpg returns 503 when no frame is available."""
+        response = client.get("/cam.jpg")
+        assert response.status_code == 503
+
+    def test_camera_snapshot_returns_frame(self, server: MonsterWebServer, client) -> None:
+        """Test that /cam.jpg serves the frame from the camera callback."""
+        server._frame_callback = lambda: b"\xff\xd8jpeg-bytes"
+        response = client.get("/cam.jpg")
+        assert response.status_code == 200
+        assert response.mimetype == "image/jpeg"
+        assert response.data == b"\xff\xd8jpeg-bytes"
+
+    def test_set_motors_scales_by_max_power(self, server: MonsterWebServer) -> None:
+        """Test that motor commands are scaled by the power limit."""
+        motors = MagicMock()
+        server._motor_callback = motors
+        server._max_power = 0.5
+        result = server._set_motors(1.0, -1.0)
+        assert result is True
+        motors.assert_called_once_with(0.5, -0.5)
+
+    def test_set_motors_clamps_input(self, server: MonsterWebServer) -> None:
+        """Test that out-of-range commands are clamped to -1..1."""
+        motors = MagicMock()
+        server._motor_callback = motors
+        server._set_motors(2.0, -3.0)
+        motors.assert_called_once_with(1.0, -1.0)
+
+    def test_set_motors_refused_when_emergency_stopped(self, server: MonsterWebServer) -> None:
+        """Test that motor commands are refused during emergency stop."""
+        motors = MagicMock()
+        server._motor_callback = motors
+        server._emergency_stop.trigger("test", "Test stop")
+        motors.reset_mock()
+        result = server._set_motors(0.5, 0.5)
+        assert result is False
+        motors.assert_not_called()
+
+    def test_motor_lock_thread_safety(self, server: MonsterWebServer, pool) -> None:
+        """Test that concurrent motor commands leave a consistent state."""
+        server._motor_callback = lambda left, right: None
+
+        def hammer(value: float) -> None:
+            for _ in range(100):
+                server._set_motors(value, -value)
+
+        # map blocks until every worker finished; the workers run in
+        # parallel so the lock is still contended
+        list(pool.map(hammer, (-1.0, -0.5, 0.5, 1.0)))
+
+        # The final pair must come from a single command, not a mix of two
+        assert server._current_left == -server._current_right
+        assert -1.0 <= server._current_left <= 1.0
+
+    def test_get_telemetry_contains_motor_state(self, server: MonsterWebServer) -> None:
+        """Test that telemetry reports motor and safety state."""
+        server._battery_callback = lambda: 11.7
+        server._set_motors(0.5, -0.5)
+        telemetry = server.get_telemetry()
+        assert telemetry["left"] == 0.5
+        assert telemetry["right"] == -0.5
+        assert telemetry["battery_voltage"] == 11.7
+        assert telemetry["emergency_stopped"] is False
+
+    def test_send_telemetry_to_client_is_batched(self, server: MonsterWebServer, emit_mock: MagicMock) -> None:
+        """Test that per-client telemetry is queued and flushed as one batch."""
+        server._send_telemetry(sid="abc")
+        emit_mock.assert_not_called()
+
+        server._flush_pending()
+        emit_mock.assert_called_once()
+        args, kwargs = emit_mock.call_args
+        assert args[0] == "batch"
+        assert args[1][0][0] == "telemetry"
+        assert kwargs["to"] == "abc"
+
+    def test_send_telemetry_broadcast_without_clients(self, server: MonsterWebServer, emit_mock: MagicMock) -> None:
+        """Test that a broadcast with no open batches still emits telemetry."""
+        server._send_telemetry()
+        emit_mock.assert_called_once()
+        args = emit_mock.call_args[0]
+        assert args[0] == "batch"
+
+    def test_full_pending_batch_forces_flush(self, server: MonsterWebServer, emit_mock: MagicMock) -> None:
+        """Test that hitting the pending cap flushes without waiting."""
+        for i in range(server.BATCH_MAX_PENDING):
+            server._queue_message("abc", "ack", {"event": "drive", "n": i})
+        emit_mock.assert_called_once()
+        args = emit_mock.call_args[0]
+        assert args[0] == "batch"
+        assert len(args[1]) == server.BATCH_MAX_PENDING
+
+    def test_emergency_stop_calls_motor_callback(self, server: MonsterWebServer) -> None:
+        """Test that triggering emergency stop zeroes the motors."""
+        motors = MagicMock()
+        server._motor_callback = motors
+        server._emergency_stop.trigger("user1", "Test")
+        motors.assert_called_with(0.0, 0.0)
+        assert server._current_left == 0.0
+        assert server._current_right == 0.0